@@ -10,9 +10,10 @@ import json
 import re
 from datetime import datetime
 
-from app.models.base import SuccessResponse, PaginatedResponse, PaginationMeta
+from app.models.base import SuccessResponse, DictSuccessResponse, PaginatedResponse, PaginationMeta
 from app.middleware import require_workspace_access, require_admin_access, get_current_user
 from app.utils.supabase_client import get_client
+from app.services.automation_executor import schedule_automations
 from app.config import settings
 
 router = APIRouter(tags=["Records"])
@@ -262,7 +263,7 @@ def validate_field_value(value: Any, field: Dict[str, Any]) -> Any:
 
 @router.get(
     "/{workspace_id}/entities/{entity_id}/records",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def list_records(
     workspace_id: str,
@@ -401,7 +402,7 @@ async def list_records(
 
 @router.post(
     "/{workspace_id}/entities/{entity_id}/records",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def create_record(
     workspace_id: str,
@@ -472,8 +473,9 @@ async def create_record(
             f"by user {user['email']}"
         )
         
-        # TODO: Trigger automations
-        # await trigger_automation(workspace_id, entity_id, "record_created", created_record)
+        # Trigger automations in the background so the response does
+        # not wait on webhook/email fan-out
+        schedule_automations(workspace_id, entity_id, "record_created", created_record)
         
         return SuccessResponse(
             data={"record": created_record},
@@ -492,7 +494,7 @@ async def create_record(
 
 @router.get(
     "/{workspace_id}/entities/{entity_id}/records/{record_id}",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def get_record(
     workspace_id: str,
@@ -543,7 +545,7 @@ async def get_record(
 
 @router.put(
     "/{workspace_id}/entities/{entity_id}/records/{record_id}",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def update_record(
     workspace_id: str,
@@ -637,12 +639,22 @@ async def update_record(
             f"Record {record_id} updated by user {user['email']}"
         )
         
-        # 6. Check for field changes and trigger automations
+        # 6. Check for field changes and trigger automations in the
+        # background — the response must not wait on the fan-out
         old_data = existing_record["data"]
-        for field_name, new_value in validated_data.items():
-            if old_data.get(field_name) != new_value:
-                logger.info(f"Field {field_name} changed: {old_data.get(field_name)} -> {new_value}")
-                # TODO: Trigger field_changed automation
+        changed_fields = [
+            field_name for field_name, new_value in validated_data.items()
+            if old_data.get(field_name) != new_value
+        ]
+        if changed_fields:
+            logger.info(f"Fields changed: {', '.join(changed_fields)}")
+            schedule_automations(
+                workspace_id, entity_id, "field_updated", updated_record, old_data
+            )
+            if "status" in changed_fields:
+                schedule_automations(
+                    workspace_id, entity_id, "status_changed", updated_record, old_data
+                )
         
         return SuccessResponse(
             data={"record": updated_record},
@@ -661,7 +673,7 @@ async def update_record(
 
 @router.delete(
     "/{workspace_id}/entities/{entity_id}/records/{record_id}",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def delete_record(
     workspace_id: str,
@@ -717,7 +729,7 @@ async def delete_record(
 
 @router.delete(
     "/{workspace_id}/entities/{entity_id}/records/{record_id}/permanent",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def delete_record_permanent(
     workspace_id: str,
@@ -781,7 +793,7 @@ async def delete_record_permanent(
 
 @router.put(
     "/{workspace_id}/entities/{entity_id}/records/bulk",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def bulk_update_records(
     workspace_id: str,
@@ -879,7 +891,7 @@ async def bulk_update_records(
 
 @router.delete(
     "/{workspace_id}/entities/{entity_id}/records/bulk",
-    response_model=SuccessResponse[Dict[str, Any]]
+    response_model=DictSuccessResponse
 )
 async def bulk_delete_records(
     workspace_id: str,
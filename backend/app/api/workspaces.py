@@ -8,7 +8,7 @@ from typing import List, Dict, Any, Optional
 import logging
 from datetime import datetime
 
-from app.models.base import SuccessResponse, PaginatedResponse, PaginationMeta
+from app.models.base import SuccessResponse, DictSuccessResponse, PaginatedResponse, PaginationMeta
 from app.models.auth import InviteRequest, WorkspaceMemberResponse
 from app.middleware import (
     get_current_user,
@@ -95,7 +95,7 @@ class UpdateMemberRoleRequest(BaseModel):
 # Workspace Endpoints
 # ========================================
 
-@router.post("/generate", response_model=SuccessResponse[Dict[str, Any]])
+@router.post("/generate", response_model=DictSuccessResponse)
 async def generate_workspace_with_ai(
     request: GenerateWorkspaceRequest,
     user: Dict[str, Any] = Depends(get_current_user)
@@ -259,7 +259,7 @@ async def generate_workspace_with_ai(
         )
 
 
-@router.post("", response_model=SuccessResponse[Dict[str, Any]])
+@router.post("", response_model=DictSuccessResponse)
 async def create_workspace_manual(
     request: CreateWorkspaceRequest,
     user: Dict[str, Any] = Depends(get_current_user)
@@ -323,7 +323,7 @@ async def create_workspace_manual(
         )
 
 
-@router.get("", response_model=SuccessResponse[Dict[str, Any]])
+@router.get("", response_model=DictSuccessResponse)
 async def list_user_workspaces(
     user: Dict[str, Any] = Depends(get_current_user)
 ) -> SuccessResponse:
@@ -368,7 +368,7 @@ async def list_user_workspaces(
         )
 
 
-@router.get("/{workspace_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.get("/{workspace_id}", response_model=DictSuccessResponse)
 async def get_workspace_details(
     workspace_id: str,
     member: Dict[str, Any] = Depends(require_workspace_access)
@@ -434,7 +434,7 @@ async def get_workspace_details(
         )
 
 
-@router.put("/{workspace_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.put("/{workspace_id}", response_model=DictSuccessResponse)
 async def update_workspace(
     workspace_id: str,
     request: UpdateWorkspaceRequest,
@@ -488,7 +488,7 @@ async def update_workspace(
         )
 
 
-@router.delete("/{workspace_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.delete("/{workspace_id}", response_model=DictSuccessResponse)
 async def delete_workspace(
     workspace_id: str,
     member: Dict[str, Any] = Depends(require_owner_access)
@@ -528,7 +528,7 @@ async def delete_workspace(
 # Entity Endpoints
 # ========================================
 
-@router.get("/{workspace_id}/entities", response_model=SuccessResponse[Dict[str, Any]])
+@router.get("/{workspace_id}/entities", response_model=DictSuccessResponse)
 async def list_entities(
     workspace_id: str,
     member: Dict[str, Any] = Depends(require_workspace_access)
@@ -576,7 +576,7 @@ async def list_entities(
         )
 
 
-@router.post("/{workspace_id}/entities", response_model=SuccessResponse[Dict[str, Any]])
+@router.post("/{workspace_id}/entities", response_model=DictSuccessResponse)
 async def create_entity(
     workspace_id: str,
     request: CreateEntityRequest,
@@ -636,7 +636,7 @@ async def create_entity(
         )
 
 
-@router.put("/{workspace_id}/entities/{entity_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.put("/{workspace_id}/entities/{entity_id}", response_model=DictSuccessResponse)
 async def update_entity(
     workspace_id: str,
     entity_id: str,
@@ -704,7 +704,7 @@ async def update_entity(
         )
 
 
-@router.delete("/{workspace_id}/entities/{entity_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.delete("/{workspace_id}/entities/{entity_id}", response_model=DictSuccessResponse)
 async def delete_entity(
     workspace_id: str,
     entity_id: str,
@@ -754,7 +754,7 @@ async def delete_entity(
 # Team Management Endpoints
 # ========================================
 
-@router.get("/{workspace_id}/members", response_model=SuccessResponse[Dict[str, Any]])
+@router.get("/{workspace_id}/members", response_model=DictSuccessResponse)
 async def list_workspace_members(
     workspace_id: str,
     member: Dict[str, Any] = Depends(require_workspace_access)
@@ -803,7 +803,7 @@ async def list_workspace_members(
         )
 
 
-@router.post("/{workspace_id}/invite", response_model=SuccessResponse[Dict[str, Any]])
+@router.post("/{workspace_id}/invite", response_model=DictSuccessResponse)
 async def invite_member_to_workspace(
     workspace_id: str,
     invite: InviteRequest,
@@ -891,7 +891,7 @@ async def invite_member_to_workspace(
         )
 
 
-@router.put("/{workspace_id}/members/{user_id}/role", response_model=SuccessResponse[Dict[str, Any]])
+@router.put("/{workspace_id}/members/{user_id}/role", response_model=DictSuccessResponse)
 async def update_member_role(
     workspace_id: str,
     user_id: str,
@@ -955,7 +955,7 @@ async def update_member_role(
         )
 
 
-@router.delete("/{workspace_id}/members/{user_id}", response_model=SuccessResponse[Dict[str, Any]])
+@router.delete("/{workspace_id}/members/{user_id}", response_model=DictSuccessResponse)
 async def remove_member_from_workspace(
     workspace_id: str,
     user_id: str,
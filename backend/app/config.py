@@ -63,7 +63,23 @@ class Settings(BaseSettings):
         default="",
         description="PostgreSQL connection string"
     )
-    
+    SUPABASE_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="HTTP connection pool size for the Supabase REST session"
+    )
+    SUPABASE_MAX_KEEPALIVE: int = Field(
+        default=20,
+        description="Idle keep-alive connections retained in the Supabase pool"
+    )
+    SUPABASE_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="Read timeout for Supabase REST requests"
+    )
+    SUPABASE_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=2.0,
+        description="Connect timeout for Supabase REST requests"
+    )
+
     @field_validator("SUPABASE_URL", "SUPABASE_KEY")
     @classmethod
     def validate_supabase_required(cls, v: str, info) -> str:
@@ -83,6 +99,10 @@ class Settings(BaseSettings):
         default="gpt-4",
         description="Default OpenAI model"
     )
+    OPENAI_FAST_MODEL: str = Field(
+        default="gpt-4o-mini",
+        description="Cheaper model for simple generations (known industries, few entities)"
+    )
     OPENAI_MAX_TOKENS: int = Field(
         default=2000,
         ge=1,
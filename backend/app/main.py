@@ -10,6 +10,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.openapi.utils import get_openapi
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
 import time
@@ -42,7 +43,7 @@ async def lifespan(app: FastAPI):
     # Test Supabase connection
     try:
         from supabase_config.config import supabase_config
-        connection_ok = await supabase_config.test_connection()
+        connection_ok = await supabase_config.deep_test_connection()
         if connection_ok:
             logger.info("✅ Supabase connection successful")
         else:
@@ -60,8 +61,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"📚 API docs at: http://{settings.API_HOST}:{settings.API_PORT}/docs")
     
     yield
-    
+
     # Shutdown
+    # Close the shared OpenAI and webhook connection pools if they were
+    # ever opened
+    from app.services.ai_config_generator import close_shared_client
+    from app.services.automation_executor import close_http_client, flush_automation_logs
+    await flush_automation_logs()
+    await close_shared_client()
+    await close_http_client()
     logger.info("👋 Shutting down SmartCRM Builder API")
 
 
@@ -74,12 +82,27 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url=None,  # Disable default docs (we'll add custom)
     redoc_url=None,  # Disable default redoc
-    openapi_url=f"{settings.API_PREFIX}/openapi.json",
+    openapi_url=None if settings.is_production else f"{settings.API_PREFIX}/openapi.json",
     lifespan=lifespan,
     debug=settings.DEBUG,
 )
 
 
+def custom_openapi():
+    """Build the OpenAPI schema once and reuse it for every request"""
+    if app.openapi_schema is None:
+        app.openapi_schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            description=app.description,
+            routes=app.routes,
+        )
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+
 # ========================================
 # Middleware
 # ========================================
@@ -249,14 +272,15 @@ async def health_check():
     }
 
 
-@app.get("/docs", include_in_schema=False)
-async def custom_swagger_ui_html():
-    """Custom Swagger UI with custom styling"""
-    return get_swagger_ui_html(
-        openapi_url=app.openapi_url,
-        title=f"{settings.APP_NAME} - API Documentation",
-        swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png"
-    )
+if not settings.is_production:
+    @app.get("/docs", include_in_schema=False)
+    async def custom_swagger_ui_html():
+        """Custom Swagger UI with custom styling"""
+        return get_swagger_ui_html(
+            openapi_url=app.openapi_url,
+            title=f"{settings.APP_NAME} - API Documentation",
+            swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png"
+        )
 
 
 # ========================================
@@ -275,12 +299,16 @@ app.include_router(
 # ========================================
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    
+
     uvicorn.run(
         "app.main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
+        loop="uvloop",  # Cython event loop (uvicorn[standard])
+        http="httptools",  # C HTTP parser (uvicorn[standard])
+        workers=1 if settings.DEBUG else (os.cpu_count() or 1) * 2 + 1,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
         access_log=settings.DEBUG,
@@ -220,5 +220,7 @@ if __name__ == "__main__":
         "app.main_simple:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=True,
     )
@@ -4,6 +4,7 @@ Handles JWT token verification, user context, and workspace access control
 """
 from fastapi import Depends, HTTPException, Header, status
 from typing import Optional, Dict, Any
+import asyncio
 import logging
 from datetime import datetime
 
@@ -17,56 +18,27 @@ logger = logging.getLogger(__name__)
 # User Authentication
 # ========================================
 
-async def get_current_user(
-    authorization: Optional[str] = Header(None, description="Bearer token")
-) -> Dict[str, Any]:
+async def _verify_and_build_user(token: str) -> Dict[str, Any]:
     """
-    Extract and verify user from JWT token
-    
+    Verify a bearer token with Supabase and build the user context
+
     Args:
-        authorization: Authorization header with Bearer token
-        
+        token: JWT access token (without the "Bearer " prefix)
+
     Returns:
         User dictionary with id, email, and metadata
-        
+
     Raises:
-        HTTPException: 401 if authentication fails
+        HTTPException: 401 if verification fails
     """
-    if not authorization:
-        logger.warning("Missing authorization header")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated. Authorization header required.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if not authorization.startswith("Bearer "):
-        logger.warning("Invalid authorization header format")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials. Use Bearer token.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Extract token
-    token = authorization.replace("Bearer ", "").strip()
-    
-    if not token:
-        logger.warning("Empty bearer token")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Empty bearer token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     try:
         # Get authenticated Supabase client
         from supabase_config.config import get_authenticated_supabase_client
         supabase = get_authenticated_supabase_client(token)
-        
+
         # Verify token and get user
         user_response = supabase.auth.get_user(token)
-        
+
         if not user_response or not user_response.user:
             logger.warning("Invalid token - no user found")
             raise HTTPException(
@@ -74,9 +46,9 @@ async def get_current_user(
                 detail="Invalid or expired token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
+
         user = user_response.user
-        
+
         # Build user context
         user_context = {
             "id": user.id,
@@ -87,10 +59,10 @@ async def get_current_user(
             "updated_at": user.updated_at,
             "phone": getattr(user, 'phone', None),
         }
-        
+
         logger.info(f"User authenticated: {user.email} ({user.id})")
         return user_context
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -102,24 +74,74 @@ async def get_current_user(
         )
 
 
+async def get_current_user(
+    authorization: Optional[str] = Header(None, description="Bearer token")
+) -> Dict[str, Any]:
+    """
+    Extract and verify user from JWT token
+
+    Args:
+        authorization: Authorization header with Bearer token
+
+    Returns:
+        User dictionary with id, email, and metadata
+
+    Raises:
+        HTTPException: 401 if authentication fails
+    """
+    if not authorization:
+        logger.warning("Missing authorization header")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated. Authorization header required.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not authorization.startswith("Bearer "):
+        logger.warning("Invalid authorization header format")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials. Use Bearer token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Extract token
+    token = authorization.replace("Bearer ", "").strip()
+
+    if not token:
+        logger.warning("Empty bearer token")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Empty bearer token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return await _verify_and_build_user(token)
+
+
 async def get_current_user_optional(
     authorization: Optional[str] = Header(None)
 ) -> Optional[Dict[str, Any]]:
     """
     Get current user if authenticated, None otherwise
     Useful for endpoints that work with or without authentication
-    
+
     Args:
         authorization: Optional authorization header
-        
+
     Returns:
         User dict if authenticated, None otherwise
     """
-    if not authorization:
+    # Fast path: no exception/traceback cost for anonymous traffic
+    if not authorization or not authorization.startswith("Bearer "):
         return None
-    
+
+    token = authorization[7:].strip()
+    if not token:
+        return None
+
     try:
-        return await get_current_user(authorization)
+        return await _verify_and_build_user(token)
     except HTTPException:
         return None
 
@@ -373,7 +395,9 @@ async def get_user_workspaces(user_id: str) -> list:
     Returns:
         List of workspace memberships with workspace data
     """
-    return get_user_workspaces_sync(user_id)
+    # Run the blocking Supabase SDK call in a worker thread so the
+    # event loop stays free for other requests during the query
+    return await asyncio.to_thread(get_user_workspaces_sync, user_id)
 
 
 def has_permission(
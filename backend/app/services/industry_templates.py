@@ -1,7 +1,14 @@
 """
 Pre-built industry templates for CRM configuration
 Example configurations for common industries
+
+Templates are static data, so each CRMConfig object graph (dozens of
+entity/field/automation models) is built once at import and shared as a
+frozen singleton. Callers that need a mutable variant must
+model_copy(deep=True) first.
 """
+from typing import Callable, Dict
+
 from app.services.ai_config_generator import (
     CRMConfig,
     EntityConfig,
@@ -14,7 +21,12 @@ from app.services.ai_config_generator import (
 # Real Estate Agency Template
 # ========================================
 
-def get_real_estate_template() -> CRMConfig:
+# Option sets reused across templates, hoisted so every FieldConfig
+# referencing them shares one immutable tuple
+_APPOINTMENT_STATUS = ("scheduled", "completed", "cancelled", "no_show")
+
+
+def _build_real_estate() -> CRMConfig:
     """
     Complete CRM configuration for real estate agency
     
@@ -41,14 +53,14 @@ def get_real_estate_template() -> CRMConfig:
                         display_name="Property Type",
                         type="select",
                         required=True,
-                        options=["house", "apartment", "condo", "townhouse", "land", "commercial"]
+                        options=("house", "apartment", "condo", "townhouse", "land", "commercial")
                     ),
                     FieldConfig(
                         name="listing_type",
                         display_name="Listing Type",
                         type="select",
                         required=True,
-                        options=["for_sale", "for_rent", "sold", "rented"]
+                        options=("for_sale", "for_rent", "sold", "rented")
                     ),
                     FieldConfig(name="bedrooms", display_name="Bedrooms", type="number"),
                     FieldConfig(name="bathrooms", display_name="Bathrooms", type="number"),
@@ -62,7 +74,7 @@ def get_real_estate_template() -> CRMConfig:
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["available", "pending", "sold", "off_market"],
+                        options=("available", "pending", "sold", "off_market"),
                         default_value="available"
                     ),
                 ],
@@ -86,7 +98,7 @@ def get_real_estate_template() -> CRMConfig:
                         name="preferred_type",
                         display_name="Preferred Property Type",
                         type="multiselect",
-                        options=["house", "apartment", "condo", "townhouse"]
+                        options=("house", "apartment", "condo", "townhouse")
                     ),
                     FieldConfig(name="preferred_location", display_name="Preferred Location", type="text"),
                     FieldConfig(
@@ -94,7 +106,7 @@ def get_real_estate_template() -> CRMConfig:
                         display_name="Buyer Status",
                         type="select",
                         required=True,
-                        options=["lead", "qualified", "viewing", "offer_made", "purchased"],
+                        options=("lead", "qualified", "viewing", "offer_made", "purchased"),
                         default_value="lead"
                     ),
                     FieldConfig(name="notes", display_name="Notes", type="textarea"),
@@ -119,7 +131,7 @@ def get_real_estate_template() -> CRMConfig:
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["scheduled", "completed", "cancelled", "no_show"],
+                        options=_APPOINTMENT_STATUS,
                         default_value="scheduled"
                     ),
                     FieldConfig(name="agent_notes", display_name="Agent Notes", type="textarea"),
@@ -157,7 +169,7 @@ def get_real_estate_template() -> CRMConfig:
 # Recruitment Agency Template
 # ========================================
 
-def get_recruitment_template() -> CRMConfig:
+def _build_recruitment() -> CRMConfig:
     """
     Complete CRM configuration for recruitment agency
     
@@ -185,7 +197,7 @@ def get_recruitment_template() -> CRMConfig:
                         name="skills",
                         display_name="Skills",
                         type="multiselect",
-                        options=["Python", "JavaScript", "React", "Node.js", "SQL", "AWS", "Docker", "Leadership"]
+                        options=("Python", "JavaScript", "React", "Node.js", "SQL", "AWS", "Docker", "Leadership")
                     ),
                     FieldConfig(name="linkedin_url", display_name="LinkedIn", type="url"),
                     FieldConfig(name="resume_url", display_name="Resume", type="file"),
@@ -195,7 +207,7 @@ def get_recruitment_template() -> CRMConfig:
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["sourced", "contacted", "screening", "interviewing", "offer", "placed", "rejected"],
+                        options=("sourced", "contacted", "screening", "interviewing", "offer", "placed", "rejected"),
                         default_value="sourced"
                     ),
                     FieldConfig(name="notes", display_name="Notes", type="textarea"),
@@ -218,7 +230,7 @@ def get_recruitment_template() -> CRMConfig:
                         name="job_type",
                         display_name="Job Type",
                         type="select",
-                        options=["full_time", "part_time", "contract", "temporary", "remote"]
+                        options=("full_time", "part_time", "contract", "temporary", "remote")
                     ),
                     FieldConfig(name="salary_min", display_name="Salary Min", type="currency"),
                     FieldConfig(name="salary_max", display_name="Salary Max", type="currency"),
@@ -229,7 +241,7 @@ def get_recruitment_template() -> CRMConfig:
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["open", "on_hold", "filled", "cancelled"],
+                        options=("open", "on_hold", "filled", "cancelled"),
                         default_value="open"
                     ),
                     FieldConfig(name="posted_date", display_name="Posted Date", type="date"),
@@ -253,14 +265,14 @@ def get_recruitment_template() -> CRMConfig:
                         name="type",
                         display_name="Interview Type",
                         type="select",
-                        options=["phone_screen", "video", "in_person", "technical", "final"]
+                        options=("phone_screen", "video", "in_person", "technical", "final")
                     ),
                     FieldConfig(name="interviewer", display_name="Interviewer", type="text"),
                     FieldConfig(
                         name="status",
                         display_name="Status",
                         type="select",
-                        options=["scheduled", "completed", "cancelled", "no_show"],
+                        options=_APPOINTMENT_STATUS,
                         default_value="scheduled"
                     ),
                     FieldConfig(name="feedback", display_name="Feedback", type="textarea"),
@@ -268,7 +280,7 @@ def get_recruitment_template() -> CRMConfig:
                         name="rating",
                         display_name="Rating",
                         type="select",
-                        options=["poor", "fair", "good", "excellent"]
+                        options=("poor", "fair", "good", "excellent")
                     ),
                 ],
                 views=["table", "calendar"],
@@ -303,7 +315,7 @@ def get_recruitment_template() -> CRMConfig:
 # Consulting Firm Template
 # ========================================
 
-def get_consulting_template() -> CRMConfig:
+def _build_consulting() -> CRMConfig:
     """
     Complete CRM configuration for consulting firm
     
@@ -327,14 +339,14 @@ def get_consulting_template() -> CRMConfig:
                     FieldConfig(name="phone", display_name="Phone", type="phone"),
                     FieldConfig(name="industry", display_name="Industry", type="text"),
                     FieldConfig(name="company_size", display_name="Company Size", type="select", 
-                               options=["1-10", "11-50", "51-200", "201-500", "500+"]),
+                               options=("1-10", "11-50", "51-200", "201-500", "500+")),
                     FieldConfig(name="website", display_name="Website", type="url"),
                     FieldConfig(
                         name="status",
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["prospect", "active", "inactive", "churned"],
+                        options=("prospect", "active", "inactive", "churned"),
                         default_value="prospect"
                     ),
                     FieldConfig(name="notes", display_name="Notes", type="textarea"),
@@ -361,12 +373,12 @@ def get_consulting_template() -> CRMConfig:
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["proposal", "approved", "in_progress", "on_hold", "completed", "cancelled"],
+                        options=("proposal", "approved", "in_progress", "on_hold", "completed", "cancelled"),
                         default_value="proposal"
                     ),
                     FieldConfig(name="project_manager", display_name="Project Manager", type="user"),
                     FieldConfig(name="team_members", display_name="Team Members", type="multiselect", 
-                               options=["Consultant A", "Consultant B", "Analyst C"]),
+                               options=("Consultant A", "Consultant B", "Analyst C")),
                 ],
                 views=["table", "kanban", "timeline"],
                 default_view="kanban",
@@ -391,7 +403,7 @@ def get_consulting_template() -> CRMConfig:
 # Sales Organization Template
 # ========================================
 
-def get_sales_template() -> CRMConfig:
+def _build_sales() -> CRMConfig:
     """
     Complete CRM configuration for sales organization
     
@@ -418,14 +430,14 @@ def get_sales_template() -> CRMConfig:
                         name="source",
                         display_name="Lead Source",
                         type="select",
-                        options=["website", "referral", "cold_call", "social_media", "event", "advertisement"]
+                        options=("website", "referral", "cold_call", "social_media", "event", "advertisement")
                     ),
                     FieldConfig(
                         name="status",
                         display_name="Status",
                         type="select",
                         required=True,
-                        options=["new", "contacted", "qualified", "proposal", "negotiation", "won", "lost"],
+                        options=("new", "contacted", "qualified", "proposal", "negotiation", "won", "lost"),
                         default_value="new"
                     ),
                     FieldConfig(name="estimated_value", display_name="Estimated Value", type="currency"),
@@ -451,7 +463,7 @@ def get_sales_template() -> CRMConfig:
                         display_name="Stage",
                         type="select",
                         required=True,
-                        options=["prospecting", "qualification", "proposal", "negotiation", "closed_won", "closed_lost"],
+                        options=("prospecting", "qualification", "proposal", "negotiation", "closed_won", "closed_lost"),
                         default_value="prospecting"
                     ),
                     FieldConfig(name="probability", display_name="Win Probability %", type="number"),
@@ -491,13 +503,61 @@ def get_sales_template() -> CRMConfig:
 # Template Registry
 # ========================================
 
-INDUSTRY_TEMPLATES = {
-    "real_estate": get_real_estate_template,
-    "recruitment": get_recruitment_template,
-    "consulting": get_consulting_template,
-    "sales": get_sales_template,
+# Each template is built on first access, not at import: a handler that
+# only needs list_available_templates (or one industry) never pays for
+# the other object graphs. Once built, a template stays cached as a
+# shared frozen singleton.
+_BUILDERS: Dict[str, Callable[[], CRMConfig]] = {
+    "real_estate": _build_real_estate,
+    "recruitment": _build_recruitment,
+    "consulting": _build_consulting,
+    "sales": _build_sales,
 }
 
+_TEMPLATE_CACHE: Dict[str, CRMConfig] = {}
+
+
+def _template(key: str) -> CRMConfig:
+    """Return the cached singleton for a known industry key, building it
+    on first use"""
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        template = _TEMPLATE_CACHE[key] = _BUILDERS[key]()
+    return template
+
+
+def __getattr__(name: str):
+    # PEP 562: INDUSTRY_TEMPLATES stays importable for back-compat but
+    # only materializes the full instance dict when actually accessed
+    if name == "INDUSTRY_TEMPLATES":
+        return {key: _template(key) for key in _BUILDERS}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_real_estate_template() -> CRMConfig:
+    """Real estate agency template (shared singleton)"""
+    return _template("real_estate")
+
+
+def get_recruitment_template() -> CRMConfig:
+    """Recruitment agency template (shared singleton)"""
+    return _template("recruitment")
+
+
+def get_consulting_template() -> CRMConfig:
+    """Consulting firm template (shared singleton)"""
+    return _template("consulting")
+
+
+def get_sales_template() -> CRMConfig:
+    """Sales pipeline template (shared singleton)"""
+    return _template("sales")
+
+
+# Formatted once: the availability list only changes when a builder is
+# registered above
+_AVAILABLE_TEMPLATES_STR = ", ".join(_BUILDERS.keys())
+
 
 def get_industry_template(industry: str) -> CRMConfig:
     """
@@ -512,13 +572,14 @@ def get_industry_template(industry: str) -> CRMConfig:
     Raises:
         ValueError: If industry template not found
     """
-    if industry.lower() not in INDUSTRY_TEMPLATES:
+    key = industry.lower()
+    if key not in _BUILDERS:
         raise ValueError(
             f"Industry template '{industry}' not found. "
-            f"Available: {', '.join(INDUSTRY_TEMPLATES.keys())}"
+            f"Available: {_AVAILABLE_TEMPLATES_STR}"
         )
-    
-    return INDUSTRY_TEMPLATES[industry.lower()]()
+
+    return _template(key)
 
 
 def list_available_templates() -> list[str]:
@@ -528,4 +589,4 @@ def list_available_templates() -> list[str]:
     Returns:
         List of industry names
     """
-    return list(INDUSTRY_TEMPLATES.keys())
+    return list(_BUILDERS.keys())
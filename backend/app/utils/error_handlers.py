@@ -6,14 +6,15 @@ from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from typing import Optional, Dict, Any
 import logging
-import traceback
-from datetime import datetime
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import time
+from datetime import datetime, timezone
+
+# Configure logging once; repeated imports must not stack handlers
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
 
@@ -111,6 +112,22 @@ class ExternalServiceError(CRMException):
         )
 
 
+# ~1ms-resolution cached UTC timestamp: every error response carries
+# one, and rebuilding a datetime plus ISO string per response is wasted
+# work during error bursts. Timezone-aware, replacing the deprecated
+# datetime.utcnow().
+_last_ts = [0.0, ""]
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO string, cached at ~1ms resolution"""
+    now = time.time()
+    if now - _last_ts[0] > 0.001:
+        _last_ts[0] = now
+        _last_ts[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+    return _last_ts[1]
+
+
 # Error Response Formatter
 def format_error_response(
     message: str,
@@ -127,7 +144,7 @@ def format_error_response(
             "code": error_code,
             "status_code": status_code,
             "details": details or {},
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _iso_now()
         }
     }
 
@@ -136,13 +153,15 @@ def format_error_response(
 async def crm_exception_handler(request: Request, exc: CRMException) -> JSONResponse:
     """Handle custom CRM exceptions"""
     
+    # Starlette rebuilds the URL string from components on every str()
+    url = str(request.url)
     logger.error(
-        f"CRM Error: {exc.error_code} - {exc.message}",
+        "CRM Error: %s - %s", exc.error_code, exc.message,
         extra={
             "error_code": exc.error_code,
             "status_code": exc.status_code,
             "details": exc.details,
-            "path": str(request.url)
+            "path": url
         }
     )
     
@@ -160,11 +179,12 @@ async def crm_exception_handler(request: Request, exc: CRMException) -> JSONResp
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handle FastAPI HTTP exceptions"""
     
+    url = str(request.url)
     logger.warning(
-        f"HTTP {exc.status_code}: {exc.detail}",
+        "HTTP %s: %s", exc.status_code, exc.detail,
         extra={
             "status_code": exc.status_code,
-            "path": str(request.url)
+            "path": url
         }
     )
     
@@ -181,14 +201,14 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unhandled exceptions"""
     
-    # Log full traceback for debugging
+    # exc_info=True already hands the logging framework the live
+    # exception; formatting the traceback a second time into extra just
+    # doubled the cost of every unhandled error
+    url = str(request.url)
     logger.error(
-        f"Unhandled exception: {str(exc)}",
+        "Unhandled exception: %s", exc,
         exc_info=True,
-        extra={
-            "path": str(request.url),
-            "traceback": traceback.format_exc()
-        }
+        extra={"path": url}
     )
     
     # Don't expose internal errors in production
@@ -205,9 +225,10 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 async def validation_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle Pydantic validation exceptions"""
     
+    url = str(request.url)
     logger.warning(
-        f"Validation error: {str(exc)}",
-        extra={"path": str(request.url)}
+        "Validation error: %s", exc,
+        extra={"path": url}
     )
     
     # Extract validation errors if available
@@ -229,11 +250,12 @@ async def validation_exception_handler(request: Request, exc: Exception) -> JSON
 # Utility functions
 def log_request(request: Request):
     """Log incoming request"""
+    path = request.url.path
     logger.info(
-        f"{request.method} {request.url.path}",
+        "%s %s", request.method, path,
         extra={
             "method": request.method,
-            "path": str(request.url.path),
+            "path": path,
             "client": request.client.host if request.client else None
         }
     )
@@ -242,7 +264,7 @@ def log_request(request: Request):
 def log_response(status_code: int, path: str):
     """Log response"""
     logger.info(
-        f"Response {status_code} for {path}",
+        "Response %s for %s", status_code, path,
         extra={
             "status_code": status_code,
             "path": path
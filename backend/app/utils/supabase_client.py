@@ -2,13 +2,25 @@
 Supabase client utilities and helper functions
 Provides typed interfaces for Supabase operations
 """
-from typing import Optional, Dict, Any, List, TypeVar, Generic
-from supabase import Client
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, TypeVar, Generic, TYPE_CHECKING
+import asyncio
+import functools
 import logging
+import time
+from types import MappingProxyType
 
+from app.config import settings
+
+# Type-only: importing supabase eagerly would drag in httpx/postgrest/
+# gotrue at module import; the Client annotations below are quoted so
+# the import happens only under TYPE_CHECKING.
+if TYPE_CHECKING:
+    from supabase import Client
 from supabase_config.config import (
     get_supabase_client,
     get_authenticated_supabase_client,
+    get_database,
     SupabaseDatabase
 )
 
@@ -16,12 +28,17 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Role ranks for access checks, hoisted out of check_workspace_access
+# (it runs from auth middleware on every request) and frozen so nothing
+# can reorder the hierarchy at runtime
+_ROLE_RANK = MappingProxyType({"owner": 3, "admin": 2, "member": 1})
+
 
 # ========================================
 # Helper Functions
 # ========================================
 
-def get_client(access_token: Optional[str] = None, use_service_role: bool = False) -> Client:
+def get_client(access_token: Optional[str] = None, use_service_role: bool = False) -> "Client":
     """
     Get Supabase client
     
@@ -37,7 +54,16 @@ def get_client(access_token: Optional[str] = None, use_service_role: bool = Fals
     return get_supabase_client(use_service_role=use_service_role)
 
 
-def get_db(client: Optional[Client] = None) -> SupabaseDatabase:
+# Pre-bound accessors: most call sites use the same mode every time, so
+# these collapse get_client's per-call branching into a direct call.
+# The underlying clients are lazy singletons in supabase_config, so
+# repeated calls return the same Client object.
+get_anon_client = functools.partial(get_supabase_client, use_service_role=False)
+get_service_client = functools.partial(get_supabase_client, use_service_role=True)
+get_user_client = get_authenticated_supabase_client
+
+
+def get_db(client: Optional["Client"] = None) -> SupabaseDatabase:
     """
     Get database helper instance
     
@@ -47,18 +73,191 @@ def get_db(client: Optional[Client] = None) -> SupabaseDatabase:
     Returns:
         SupabaseDatabase helper instance
     """
-    from supabase_config.config import get_database
     return get_database(client)
 
 
+# ========================================
+# Read Cache
+# ========================================
+
+# Short-TTL LRU over the read-heavy helpers: these lookups run on every
+# request and their rows change at human speed, so a few seconds of
+# staleness buys back a full HTTPS round trip per hit. Plain OrderedDict
+# keeps this dependency-free (cachetools is not a dependency here).
+_READ_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_READ_CACHE_MAX = 10_000
+_READ_CACHE_TTL = 30.0  # seconds
+
+
+def _read_cache_get(key: tuple) -> Optional[tuple]:
+    """Return (value,) if cached and fresh, else None"""
+    entry = _READ_CACHE.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if time.monotonic() >= expires:
+        del _READ_CACHE[key]
+        return None
+    _READ_CACHE.move_to_end(key)
+    return (value,)
+
+
+def _read_cache_put(key: tuple, value: Any) -> None:
+    """Insert a value, evicting the least recently used past capacity"""
+    _READ_CACHE[key] = (time.monotonic() + _READ_CACHE_TTL, value)
+    _READ_CACHE.move_to_end(key)
+    while len(_READ_CACHE) > _READ_CACHE_MAX:
+        _READ_CACHE.popitem(last=False)
+
+
+def invalidate_read_cache(table: Optional[str] = None, record_id: Optional[str] = None) -> None:
+    """Drop cached reads for a table (optionally one record)
+
+    Called by the write helpers; membership-affecting tables also drop
+    the workspace/access entries derived from them.
+    """
+    if table is None:
+        _READ_CACHE.clear()
+        return
+    stale = [
+        key for key in _READ_CACHE
+        if (key[0] == "row" and key[1] == table and (record_id is None or key[2] == record_id))
+        or (table in ("workspaces", "workspace_members") and key[0] in ("workspaces", "access"))
+    ]
+    for key in stale:
+        del _READ_CACHE[key]
+
+
+def read_cache_clear() -> None:
+    """Clear the read cache entirely (tests, manual invalidation)"""
+    _READ_CACHE.clear()
+
+
+# Single-flight: on a cache miss under load, dozens of requests can ask
+# for the same key at once; only the first hits Supabase, the rest
+# await its future. Keys match the read cache above.
+_INFLIGHT_READS: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, fetch) -> Any:
+    """Run fetch() once per key across concurrent callers"""
+    existing = _INFLIGHT_READS.get(key)
+    if existing is not None:
+        return await existing
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT_READS[key] = future
+    try:
+        value = await fetch()
+        future.set_result(value)
+        return value
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved in case no duplicate caller ever awaits it
+        future.exception()
+        raise
+    finally:
+        del _INFLIGHT_READS[key]
+
+
 # ========================================
 # Query Builder Helpers
 # ========================================
 
+# Filter ops whose query shape can be compiled once and reused with
+# fresh values — the client-side analogue of a prepared statement
+_COMPILABLE_FILTERS = frozenset({"eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike"})
+
+
+def _clean_select_columns(columns: str) -> str:
+    """Normalize a select string the way postgrest's builder does
+
+    Strips whitespace outside double quotes, so "a, b(*)" emits the
+    a,b(*) form PostgREST accepts; raw whitespace in the select param
+    is rejected with a 400.
+    """
+    from postgrest.base_request_builder import _cleaned_columns
+
+    return _cleaned_columns((columns,))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_spec(table: str, columns: str, shape: tuple):
+    """Compile a query shape into a value-binding param builder
+
+    The shape carries op names and columns but no concrete values, so
+    identical queries across requests hit the same cache entry and the
+    per-execute cost drops to substituting values into prebuilt pairs.
+    Columns and filter names are sanitized exactly as the fluent
+    builder would. Returns None when the shape contains ops the
+    compiler doesn't handle (IN lists, single(), ...).
+    """
+    from postgrest.utils import sanitize_param
+
+    columns = _clean_select_columns(columns)
+    steps = []
+    for part in shape:
+        name = part[0]
+        if name in _COMPILABLE_FILTERS:
+            steps.append(("bind", sanitize_param(part[1]), name + "."))
+        elif name == "order":
+            steps.append(("const", "order", f"{part[1]}.{'desc' if part[2] else 'asc'}"))
+        elif name == "limit":
+            steps.append(("bind_raw", "limit", None))
+        elif name == "range":
+            steps.append(("range", None, None))
+        else:
+            return None
+
+    def bind(values: tuple) -> List[tuple]:
+        params = [("select", columns)]
+        bound = iter(values)
+        for kind, key, extra in steps:
+            if kind == "bind":
+                params.append((key, extra + _pgrst_literal(next(bound))))
+            elif kind == "const":
+                params.append((key, extra))
+            elif kind == "bind_raw":
+                params.append((key, str(next(bound))))
+            else:
+                start, end = next(bound), next(bound)
+                params.append(("offset", str(start)))
+                params.append(("limit", str(end - start + 1)))
+        return params
+
+    return bind
+
+
+async def _pgrst_get(client: "Client", table: str, params: List[tuple]) -> List[Dict[str, Any]]:
+    """GET straight through the pooled PostgREST session
+
+    Bypasses the fluent builder. The client-level headers (apikey and,
+    for authenticated clients, the bearer token) are attached per
+    request because postgrest keeps them on the client object, not on
+    the httpx session.
+    """
+    import orjson
+
+    postgrest = client.postgrest
+    response = await asyncio.to_thread(
+        postgrest.session.get,
+        f"/{table}",
+        params=params,
+        headers=dict(postgrest.headers),
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
 class QueryBuilder(Generic[T]):
     """
     Type-safe query builder for Supabase
     
+    Filter calls accumulate a lightweight op spec; the PostgREST
+    request is assembled once in execute(), so chaining 5-8 filters
+    costs list appends instead of repeated URL re-encoding. The spec
+    (see spec_key) is hashable, which also makes queries cacheable by
+    shape.
+    
     Example:
         users = await QueryBuilder(client, "users") \\
             .select("*") \\
@@ -68,7 +267,9 @@ class QueryBuilder(Generic[T]):
             .execute()
     """
     
-    def __init__(self, client: Client, table: str):
+    __slots__ = ("client", "table", "_ops", "_columns")
+    
+    def __init__(self, client: "Client", table: str):
         """
         Initialize query builder
         
@@ -78,93 +279,158 @@ class QueryBuilder(Generic[T]):
         """
         self.client = client
         self.table = table
-        self._query = client.table(table)
+        self._columns: Optional[str] = None
+        self._ops: List[tuple] = []
     
     def select(self, columns: str = "*") -> "QueryBuilder[T]":
         """Select columns"""
-        self._query = self._query.select(columns)
+        self._columns = columns
         return self
     
     def eq(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column equals value"""
-        self._query = self._query.eq(column, value)
+        self._ops.append(("eq", column, value))
         return self
     
     def neq(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column not equals value"""
-        self._query = self._query.neq(column, value)
+        self._ops.append(("neq", column, value))
         return self
     
     def gt(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column greater than value"""
-        self._query = self._query.gt(column, value)
+        self._ops.append(("gt", column, value))
         return self
     
     def gte(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column greater than or equal to value"""
-        self._query = self._query.gte(column, value)
+        self._ops.append(("gte", column, value))
         return self
     
     def lt(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column less than value"""
-        self._query = self._query.lt(column, value)
+        self._ops.append(("lt", column, value))
         return self
     
     def lte(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column less than or equal to value"""
-        self._query = self._query.lte(column, value)
+        self._ops.append(("lte", column, value))
         return self
     
     def like(self, column: str, pattern: str) -> "QueryBuilder[T]":
         """Filter with LIKE pattern"""
-        self._query = self._query.like(column, pattern)
+        self._ops.append(("like", column, pattern))
         return self
     
     def ilike(self, column: str, pattern: str) -> "QueryBuilder[T]":
         """Filter with case-insensitive LIKE pattern"""
-        self._query = self._query.ilike(column, pattern)
+        self._ops.append(("ilike", column, pattern))
         return self
     
     def is_(self, column: str, value: Any) -> "QueryBuilder[T]":
         """Filter where column IS value (for NULL checks)"""
-        self._query = self._query.is_(column, value)
+        self._ops.append(("is_", column, value))
         return self
     
     def in_(self, column: str, values: List[Any]) -> "QueryBuilder[T]":
         """Filter where column IN values"""
-        self._query = self._query.in_(column, values)
+        self._ops.append(("in_", column, tuple(values)))
         return self
     
     def order(self, column: str, desc: bool = False) -> "QueryBuilder[T]":
         """Order by column"""
-        self._query = self._query.order(column, desc=desc)
+        self._ops.append(("order", column, desc))
         return self
     
     def limit(self, count: int) -> "QueryBuilder[T]":
         """Limit results"""
-        self._query = self._query.limit(count)
+        self._ops.append(("limit", count))
         return self
     
     def offset(self, count: int) -> "QueryBuilder[T]":
-        """Offset results"""
-        self._query = self._query.range(count, count + 999999)
+        """Offset results
+        
+        Note: OFFSET makes Postgres scan and discard `count` rows on
+        every page — O(n) per page. For anything past ~1000 rows use
+        after() with the last row's created_at or id instead.
+        """
+        self._ops.append(("range", count, count + 999999))
+        return self
+    
+    def after(self, column: str, value: Any, limit: int) -> "QueryBuilder[T]":
+        """Keyset pagination: rows where column > value, ordered
+        
+        Turns the query plan into an index range scan instead of the
+        scan-and-discard that OFFSET costs; preferred for deep pages.
+        Pass the paginating column's value from the previous page's
+        last row.
+        """
+        self._ops.append(("gt", column, value))
+        self._ops.append(("order", column, False))
+        self._ops.append(("limit", limit))
         return self
     
     def range(self, start: int, end: int) -> "QueryBuilder[T]":
         """Range of results"""
-        self._query = self._query.range(start, end)
+        self._ops.append(("range", start, end))
         return self
     
     def single(self) -> "QueryBuilder[T]":
         """Expect single result"""
-        self._query = self._query.single()
+        self._ops.append(("single",))
         return self
     
     def maybe_single(self) -> "QueryBuilder[T]":
         """Maybe return single result"""
-        self._query = self._query.maybe_single()
+        self._ops.append(("maybe_single",))
         return self
     
+    @property
+    def spec_key(self) -> tuple:
+        """Hashable description of this query (table, columns, ops)"""
+        return (self.table, self._columns, tuple(self._ops))
+    
+    def _shape_and_values(self):
+        """Split ops into a hashable value-free shape plus bound values
+        
+        Returns (None, None) when any op or value is outside what
+        _compile_spec handles, sending execute() down the builder path.
+        """
+        shape = []
+        values = []
+        for op in self._ops:
+            name = op[0]
+            if name in _COMPILABLE_FILTERS:
+                if not isinstance(op[2], (str, int, float, bool)):
+                    return None, None
+                shape.append((name, op[1]))
+                values.append(op[2])
+            elif name == "order":
+                shape.append(op)
+            elif name == "limit":
+                shape.append(("limit",))
+                values.append(op[1])
+            elif name == "range":
+                shape.append(("range",))
+                values.append(op[1])
+                values.append(op[2])
+            else:
+                return None, None
+        return tuple(shape), tuple(values)
+    
+    def _build(self):
+        """Assemble the PostgREST request from the accumulated spec"""
+        query = self.client.table(self.table).select(self._columns or "*")
+        for op in self._ops:
+            name = op[0]
+            if name == "order":
+                query = query.order(op[1], desc=op[2])
+            elif name == "in_":
+                query = query.in_(op[1], list(op[2]))
+            else:
+                query = getattr(query, name)(*op[1:])
+        return query
+    
     async def execute(self) -> List[Dict[str, Any]]:
         """
         Execute query and return results
@@ -173,7 +439,18 @@ class QueryBuilder(Generic[T]):
             List of results
         """
         try:
-            result = self._query.execute()
+            # Prepared path: compile this query's shape once (cached
+            # across requests) and just bind today's values
+            shape, values = self._shape_and_values()
+            if shape is not None and getattr(self.client, "postgrest", None) is not None:
+                binder = _compile_spec(self.table, self._columns or "*", shape)
+                if binder is not None:
+                    data = await _pgrst_get(self.client, self.table, binder(values))
+                    return data if data else []
+            
+            # supabase-py is synchronous; run the round trip in a worker
+            # thread so the event loop keeps serving other requests
+            result = await asyncio.to_thread(self._build().execute)
             return result.data if result.data else []
         except Exception as e:
             logger.error(f"Query execution failed: {str(e)}")
@@ -187,7 +464,9 @@ class QueryBuilder(Generic[T]):
             Record count
         """
         try:
-            result = self._query.execute(count="exact")
+            result = await asyncio.to_thread(
+                functools.partial(self._build().execute, count="exact")
+            )
             return result.count if hasattr(result, 'count') else 0
         except Exception as e:
             logger.error(f"Count query failed: {str(e)}")
@@ -199,7 +478,7 @@ class QueryBuilder(Generic[T]):
 # ========================================
 
 async def get_by_id(
-    client: Client,
+    client: "Client",
     table: str,
     record_id: str,
     columns: str = "*"
@@ -216,21 +495,68 @@ async def get_by_id(
     Returns:
         Record dict or None if not found
     """
-    try:
+    cache_key = ("row", table, record_id, columns)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    async def _fetch() -> Optional[Dict[str, Any]]:
         result = await QueryBuilder(client, table) \
             .select(columns) \
             .eq("id", record_id) \
             .maybe_single() \
             .execute()
         
-        return result[0] if result else None
+        record = result[0] if result else None
+        _read_cache_put(cache_key, record)
+        return record
+
+    try:
+        return await _single_flight(cache_key, _fetch)
     except Exception as e:
         logger.error(f"Get by ID failed for {table}/{record_id}: {str(e)}")
         raise
 
 
+async def get_by_ids(
+    client: "Client",
+    table: str,
+    ids: List[str],
+    columns: str = "*"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get many records by ID in one round trip
+    
+    Batches what would otherwise be N get_by_id calls into a single
+    IN query; network RTT dominates Supabase latency, so this is the
+    cheap way to hydrate a list of foreign keys.
+    
+    Args:
+        client: Supabase client
+        table: Table name
+        ids: Record IDs to fetch
+        columns: Columns to select
+        
+    Returns:
+        Dict mapping record ID to record, missing IDs absent
+    """
+    if not ids:
+        return {}
+
+    try:
+        rows = await QueryBuilder(client, table) \
+            .select(columns) \
+            .in_("id", list(ids)) \
+            .execute()
+        
+        return {row["id"]: row for row in rows}
+    except Exception as e:
+        logger.error(f"Get by IDs failed for {table}: {str(e)}")
+        raise
+
+
 async def create_record(
-    client: Client,
+    client: "Client",
     table: str,
     data: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -246,18 +572,64 @@ async def create_record(
         Created record
     """
     try:
-        result = client.table(table).insert(data).execute()
+        result = await asyncio.to_thread(
+            lambda: client.table(table).insert(data).execute()
+        )
+        invalidate_read_cache(table)
         return result.data[0] if result.data else {}
     except Exception as e:
         logger.error(f"Create record failed for {table}: {str(e)}")
         raise
 
 
+async def create_records(
+    client: "Client",
+    table: str,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = 500
+) -> List[Dict[str, Any]]:
+    """
+    Create many records in batched inserts
+    
+    PostgREST accepts row arrays natively, so importing N rows costs
+    ceil(N / chunk_size) round trips instead of N. RLS is still
+    enforced per row. Chunking keeps each request under PostgREST's
+    body size cap.
+    
+    Args:
+        client: Supabase client
+        table: Table name
+        rows: Record dicts to insert
+        chunk_size: Max rows per request
+        
+    Returns:
+        All created records, in insert order
+    """
+    if not rows:
+        return []
+
+    created: List[Dict[str, Any]] = []
+    try:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            result = await asyncio.to_thread(
+                lambda c=chunk: client.table(table).insert(c).execute()
+            )
+            if result.data:
+                created.extend(result.data)
+        invalidate_read_cache(table)
+        return created
+    except Exception as e:
+        logger.error(f"Bulk create failed for {table}: {str(e)}")
+        raise
+
+
 async def update_record(
-    client: Client,
+    client: "Client",
     table: str,
     record_id: str,
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    return_row: bool = True
 ) -> Dict[str, Any]:
     """
     Update record
@@ -267,16 +639,23 @@ async def update_record(
         table: Table name
         record_id: Record ID
         data: Update data
+        return_row: When False, ask PostgREST for return=minimal —
+            Postgres skips serializing the updated row and the response
+            body is empty. Use it when the caller ignores the result.
         
     Returns:
-        Updated record
+        Updated record ({} when return_row is False)
     """
     try:
-        result = client.table(table) \
-            .update(data) \
-            .eq("id", record_id) \
+        returning = "representation" if return_row else "minimal"
+        result = await asyncio.to_thread(
+            lambda: client.table(table)
+            .update(data, returning=returning)
+            .eq("id", record_id)
             .execute()
+        )
         
+        invalidate_read_cache(table, record_id)
         return result.data[0] if result.data else {}
     except Exception as e:
         logger.error(f"Update record failed for {table}/{record_id}: {str(e)}")
@@ -284,7 +663,7 @@ async def update_record(
 
 
 async def delete_record(
-    client: Client,
+    client: "Client",
     table: str,
     record_id: str
 ) -> bool:
@@ -300,22 +679,81 @@ async def delete_record(
         True if deleted successfully
     """
     try:
-        client.table(table).delete().eq("id", record_id).execute()
+        # The deleted row was always discarded; return=minimal stops
+        # PostgREST from serializing it at all
+        await asyncio.to_thread(
+            lambda: client.table(table)
+            .delete(returning="minimal")
+            .eq("id", record_id)
+            .execute()
+        )
+        invalidate_read_cache(table, record_id)
         return True
     except Exception as e:
         logger.error(f"Delete record failed for {table}/{record_id}: {str(e)}")
         raise
 
 
+def _pgrst_literal(value: Any) -> str:
+    """Render a scalar the way PostgREST expects it in a filter"""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
+def _build_pgrst_params(
+    columns: str,
+    filters: Optional[Dict[str, Any]],
+    order_by: Optional[str],
+    desc: bool,
+    limit: int,
+    offset: int,
+    after: Optional[tuple]
+) -> List[tuple]:
+    """Build the PostgREST query params for a simple list query in one pass
+
+    Each fluent-builder call in supabase-py mutates builder state and
+    re-encodes params; for the common eq-filter list query this emits
+    the final param pairs directly and lets urlencode (C) do the rest.
+    Columns and filter names go through the same normalization the
+    builder applies.
+    """
+    from postgrest.utils import sanitize_param
+
+    params: List[tuple] = [("select", _clean_select_columns(columns))]
+    if filters:
+        for key, value in filters.items():
+            if value is None:
+                params.append((sanitize_param(key), "is.null"))
+            else:
+                params.append((sanitize_param(key), f"eq.{_pgrst_literal(value)}"))
+    if after is not None:
+        cursor_column, last_value = after
+        params.append((sanitize_param(cursor_column), f"gt.{_pgrst_literal(last_value)}"))
+        params.append(("order", f"{cursor_column}.asc"))
+    elif order_by:
+        params.append(("order", f"{order_by}.{'desc' if desc else 'asc'}"))
+    params.append(("limit", str(limit)))
+    if after is None and offset:
+        params.append(("offset", str(offset)))
+    return params
+
+
+_PGRST_SCALARS = (str, int, float, bool, type(None))
+
+
 async def list_records(
-    client: Client,
+    client: "Client",
     table: str,
     filters: Optional[Dict[str, Any]] = None,
     order_by: Optional[str] = None,
     desc: bool = False,
     limit: int = 50,
     offset: int = 0,
-    columns: str = "*"
+    columns: Optional[str] = None,
+    after: Optional[tuple] = None
 ) -> List[Dict[str, Any]]:
     """
     List records with filtering and pagination
@@ -327,26 +765,56 @@ async def list_records(
         order_by: Column to order by
         desc: Order descending
         limit: Max records to return
-        offset: Number of records to skip
-        columns: Columns to select
+        offset: Number of records to skip (O(n) per page — for offsets
+            past ~1000 prefer `after`)
+        columns: Columns to select. Required in production: pulling "*"
+            on a list endpoint drags every JSONB blob over the wire and
+            through the JSON parser for rows the caller mostly ignores
+        after: Keyset cursor as (column, last_value); takes precedence
+            over offset and keeps deep pages on an index range scan
         
     Returns:
         List of records
     """
+    if columns is None:
+        if settings.is_production:
+            raise ValueError(
+                f"list_records({table!r}): specify columns explicitly; "
+                "'*' is forbidden for list endpoints"
+            )
+        columns = "*"
+
     try:
+        # Fast path: scalar-only filters compile straight to PostgREST
+        # params, skipping the fluent builder entirely. List-valued
+        # (IN) filters keep the builder, which knows PostgREST's
+        # quoting rules for value lists.
+        if not filters or all(isinstance(v, _PGRST_SCALARS) for v in filters.values()):
+            params = _build_pgrst_params(
+                columns, filters, order_by, desc, limit, offset, after
+            )
+            return await _pgrst_get(client, table, params)
+        
         query = QueryBuilder(client, table).select(columns)
         
-        # Apply filters
+        # Apply filters; list-like values batch into one IN clause
+        # instead of degrading into per-value queries upstream
         if filters:
             for key, value in filters.items():
-                query = query.eq(key, value)
+                if isinstance(value, (list, tuple, set)):
+                    query = query.in_(key, list(value))
+                else:
+                    query = query.eq(key, value)
         
-        # Apply ordering
-        if order_by:
-            query = query.order(order_by, desc=desc)
-        
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply pagination: keyset cursor wins over OFFSET
+        if after is not None:
+            cursor_column, last_value = after
+            query = query.after(cursor_column, last_value, limit)
+        else:
+            # Apply ordering
+            if order_by:
+                query = query.order(order_by, desc=desc)
+            query = query.limit(limit).offset(offset)
         
         return await query.execute()
     except Exception as e:
@@ -359,7 +827,7 @@ async def list_records(
 # ========================================
 
 async def get_user_workspaces(
-    client: Client,
+    client: "Client",
     user_id: str
 ) -> List[Dict[str, Any]]:
     """
@@ -372,20 +840,106 @@ async def get_user_workspaces(
     Returns:
         List of workspaces with role info
     """
-    try:
+    cache_key = ("workspaces", user_id)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    async def _fetch() -> List[Dict[str, Any]]:
         result = await QueryBuilder(client, "workspace_members") \
             .select("workspace_id, role, workspaces(*)") \
             .eq("user_id", user_id) \
             .execute()
         
+        _read_cache_put(cache_key, result)
         return result
+
+    try:
+        return await _single_flight(cache_key, _fetch)
     except Exception as e:
         logger.error(f"Get user workspaces failed for {user_id}: {str(e)}")
         raise
 
 
+async def get_workspace_overview(
+    client: "Client",
+    user_id: str
+) -> Dict[str, Any]:
+    """
+    Get a user's workspaces plus recent activity in one wall-clock hop
+    
+    The membership join and the activity feed are independent queries,
+    so they run under asyncio.gather: total latency is the slower of
+    the two instead of their sum. A failing branch is logged and
+    degrades to empty rather than failing the whole overview.
+    
+    Args:
+        client: Supabase client
+        user_id: User ID
+        
+    Returns:
+        Dict with "workspaces" and "recent_activity" lists
+    """
+    async def _recent_activity() -> List[Dict[str, Any]]:
+        return await QueryBuilder(client, "activities") \
+            .select("id, workspace_id, activity_type, title, created_at") \
+            .eq("created_by", user_id) \
+            .order("created_at", desc=True) \
+            .limit(10) \
+            .execute()
+
+    workspaces, activity = await asyncio.gather(
+        get_user_workspaces(client, user_id),
+        _recent_activity(),
+        return_exceptions=True
+    )
+
+    if isinstance(workspaces, BaseException):
+        logger.error(f"Workspace overview: membership query failed: {workspaces}")
+        workspaces = []
+    if isinstance(activity, BaseException):
+        logger.error(f"Workspace overview: activity query failed: {activity}")
+        activity = []
+
+    return {
+        "workspaces": workspaces,
+        "recent_activity": activity,
+    }
+
+
+async def get_workspace_overview_rpc(
+    client: "Client",
+    user_id: str
+) -> List[Dict[str, Any]]:
+    """
+    Get workspace memberships with entity/record counts via one RPC
+    
+    Calls the get_user_workspace_overview() SQL function (migration
+    003), which joins memberships with per-workspace counts inside
+    Postgres. One round trip replaces a membership query plus a count
+    query per workspace, and the aggregate runs next to the data.
+    
+    Args:
+        client: Supabase client
+        user_id: User ID
+        
+    Returns:
+        List of {workspace_id, name, slug, role, entity_count, record_count}
+    """
+    try:
+        result = await asyncio.to_thread(
+            lambda: client.rpc(
+                "get_user_workspace_overview", {"uid": user_id}
+            ).execute()
+        )
+        return result.data or []
+    except Exception as e:
+        logger.error(f"Workspace overview RPC failed: {str(e)}")
+        return []
+
+
 async def check_workspace_access(
-    client: Client,
+    client: "Client",
     user_id: str,
     workspace_id: str,
     required_role: Optional[str] = None
@@ -402,23 +956,37 @@ async def check_workspace_access(
     Returns:
         True if user has access
     """
-    try:
-        query = QueryBuilder(client, "workspace_members") \
-            .select("role") \
+    if required_role is not None and required_role not in _ROLE_RANK:
+        raise ValueError(
+            f"Unknown role '{required_role}'. Valid roles: {', '.join(_ROLE_RANK)}"
+        )
+
+    cache_key = ("access", user_id, workspace_id, required_role)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    async def _fetch() -> bool:
+        # Existence check only: HEAD + count transfers no row body, and
+        # the role comparison is pushed into the query as an IN filter
+        # over the roles that rank at or above the requirement.
+        query = client.table("workspace_members") \
+            .select("user_id", head=True, count="exact") \
             .eq("user_id", user_id) \
             .eq("workspace_id", workspace_id)
-        
-        result = await query.execute()
-        
-        if not result:
-            return False
-        
         if required_role:
-            user_role = result[0].get("role")
-            role_hierarchy = {"owner": 3, "admin": 2, "member": 1}
-            return role_hierarchy.get(user_role, 0) >= role_hierarchy.get(required_role, 0)
+            min_rank = _ROLE_RANK[required_role]
+            allowed_roles = [r for r, rank in _ROLE_RANK.items() if rank >= min_rank]
+            query = query.in_("role", allowed_roles)
         
-        return True
+        result = await asyncio.to_thread(query.limit(1).execute)
+        allowed = bool(result.count)
+        
+        _read_cache_put(cache_key, allowed)
+        return allowed
+
+    try:
+        return await _single_flight(cache_key, _fetch)
     except Exception as e:
         logger.error(f"Check workspace access failed: {str(e)}")
         return False
@@ -430,13 +998,22 @@ async def check_workspace_access(
 
 __all__ = [
     "get_client",
+    "get_anon_client",
+    "get_service_client",
+    "get_user_client",
     "get_db",
     "QueryBuilder",
     "get_by_id",
+    "get_by_ids",
     "create_record",
+    "create_records",
     "update_record",
     "delete_record",
     "list_records",
     "get_user_workspaces",
+    "get_workspace_overview",
+    "get_workspace_overview_rpc",
     "check_workspace_access",
+    "invalidate_read_cache",
+    "read_cache_clear",
 ]
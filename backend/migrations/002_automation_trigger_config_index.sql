@@ -0,0 +1,11 @@
+-- =====================================================
+-- SmartCRM Builder - Automation Trigger Config Index
+-- Migration: 002_automation_trigger_config_index.sql
+-- Description: GIN index on automation_rules.trigger_config so
+--   status_changed rule lookups can filter on trigger_config->>'to_status'
+--   in Postgres instead of fetching every rule and filtering in Python
+--   (see app/services/automation_executor.py :: trigger_automations)
+-- =====================================================
+
+CREATE INDEX idx_automation_rules_trigger_config
+  ON automation_rules USING GIN(trigger_config);
@@ -0,0 +1,36 @@
+-- =====================================================
+-- SmartCRM Builder - Workspace Overview Function
+-- Migration: 003_workspace_overview_function.sql
+-- Description: STABLE SQL function that computes a user's workspace
+--   overview (memberships joined with per-workspace entity/record
+--   counts) in one round trip inside Postgres, replacing several
+--   PostgREST queries issued from Python
+--   (see app/utils/supabase_client.py :: get_workspace_overview_rpc)
+-- =====================================================
+
+CREATE FUNCTION get_user_workspace_overview(uid UUID)
+RETURNS TABLE (
+  workspace_id UUID,
+  name TEXT,
+  slug TEXT,
+  role TEXT,
+  entity_count BIGINT,
+  record_count BIGINT
+)
+LANGUAGE sql STABLE AS $$
+  SELECT
+    w.id,
+    w.name,
+    w.slug,
+    wm.role,
+    (SELECT COUNT(*) FROM crm_entities e
+      WHERE e.workspace_id = w.id AND e.is_active = true),
+    (SELECT COUNT(*) FROM crm_records r
+      WHERE r.workspace_id = w.id AND r.is_archived = false)
+  FROM workspace_members wm
+  JOIN workspaces w ON w.id = wm.workspace_id
+  WHERE wm.user_id = uid
+    AND w.is_active = true;
+$$;
+
+COMMENT ON FUNCTION get_user_workspace_overview(UUID) IS 'Workspace memberships with entity/record counts for one user, computed server-side';
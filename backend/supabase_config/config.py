@@ -2,13 +2,99 @@
 Supabase Database Configuration and Client Setup
 Provides configured Supabase client instances for different use cases
 """
-from supabase import create_client, Client
 from app.config import settings
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING
+import asyncio
 import logging
+import time
+
+# supabase-py pulls in httpx, postgrest, gotrue, storage3 and realtime;
+# importing it lazily keeps "import supabase_config" (and therefore app
+# startup on serverless) cheap until a client is actually built.
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+# Authenticated clients are cached per access token so repeat requests
+# from the same session reuse one Client (and its HTTP session) instead
+# of paying create_client() on every call. Tokens expire, so entries do
+# too; the cap bounds memory for many concurrent users.
+_AUTH_CLIENT_CACHE_MAX = 256
+_AUTH_CLIENT_TTL = 300.0  # seconds
+
+# Shared default for records created without tags. The insert path
+# only serializes it, never mutates it, so one instance can back every
+# call instead of allocating a fresh empty list per insert.
+_EMPTY_TAGS: list = []
+
+# A successful connection probe is trusted for this long, so frequent
+# /health polling doesn't turn into a Postgres query per probe
+_CONNECTION_OK_TTL = 5.0  # seconds
+
+
+def _use_orjson_response_parsing() -> None:
+    """
+    Parse PostgREST responses with orjson
+
+    postgrest-py decodes every response body through a pydantic
+    adapter; for large crm_records.data payloads the decode is
+    CPU-bound once the bytes arrive, and orjson is several times
+    faster on big JSONB documents. Malformed payloads fall back to
+    the original adapter so error behaviour is unchanged.
+    """
+    import orjson
+    from postgrest import base_request_builder as _brb
+
+    original = _brb.JSONAdapter
+    if getattr(original, "_orjson_wrapped", False):
+        return
+
+    class _OrjsonAdapter:
+        _orjson_wrapped = True
+
+        @staticmethod
+        def validate_json(content):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return original.validate_json(content)
+
+    _brb.JSONAdapter = _OrjsonAdapter
+
+
+def _tune_postgrest_session(client: "Client") -> "Client":
+    """
+    Replace the default PostgREST HTTP session with a tuned one
+
+    supabase-py builds its httpx session with library defaults; this
+    swaps in explicit pool limits and split connect/read timeouts from
+    settings so keep-alive reuse and failure detection are under our
+    control rather than the library's.
+    """
+    import httpx
+
+    _use_orjson_response_parsing()
+
+    old_session = client.postgrest.session
+    client.postgrest.session = httpx.Client(
+        base_url=old_session.base_url,
+        headers=old_session.headers,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE,
+        ),
+        timeout=httpx.Timeout(
+            settings.SUPABASE_TIMEOUT_SECONDS,
+            connect=settings.SUPABASE_CONNECT_TIMEOUT_SECONDS,
+        ),
+    )
+    old_session.close()
+    return client
+
 
 class SupabaseConfig:
     """
@@ -17,11 +103,13 @@ class SupabaseConfig:
     """
     
     def __init__(self):
-        self._anon_client: Optional[Client] = None
-        self._service_client: Optional[Client] = None
+        self._anon_client: Optional["Client"] = None
+        self._service_client: Optional["Client"] = None
+        self._auth_clients: "OrderedDict[str, tuple]" = OrderedDict()
+        self._last_ok_monotonic: float = 0.0
     
     @property
-    def anon_client(self) -> Client:
+    def anon_client(self) -> "Client":
         """
         Get Supabase client with anonymous key
         Use this for user-facing operations (respects RLS)
@@ -30,16 +118,18 @@ class SupabaseConfig:
             if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
                 raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
 
-            self._anon_client = create_client(
+            from supabase import create_client
+
+            self._anon_client = _tune_postgrest_session(create_client(
                 settings.SUPABASE_URL,
                 settings.SUPABASE_KEY
-            )
+            ))
             logger.info("Supabase anonymous client initialized")
 
         return self._anon_client
     
     @property
-    def service_client(self) -> Client:
+    def service_client(self) -> "Client":
         """
         Get Supabase client with service role key
         Use this for admin operations (bypasses RLS)
@@ -49,15 +139,17 @@ class SupabaseConfig:
             if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_KEY:
                 raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
 
-            self._service_client = create_client(
+            from supabase import create_client
+
+            self._service_client = _tune_postgrest_session(create_client(
                 settings.SUPABASE_URL,
                 settings.SUPABASE_SERVICE_KEY
-            )
+            ))
             logger.info("Supabase service client initialized")
 
         return self._service_client
     
-    def get_authenticated_client(self, access_token: str) -> Client:
+    def get_authenticated_client(self, access_token: str) -> "Client":
         """
         Get Supabase client authenticated with user token
         Use this for operations on behalf of a specific user (respects RLS)
@@ -68,29 +160,78 @@ class SupabaseConfig:
         Returns:
             Authenticated Supabase client
         """
+        now = time.monotonic()
+        entry = self._auth_clients.get(access_token)
+        if entry is not None:
+            client, created_at = entry
+            if now - created_at < _AUTH_CLIENT_TTL:
+                self._auth_clients.move_to_end(access_token)
+                return client
+            del self._auth_clients[access_token]
+            self._close_client_session(client)
+
+        from supabase import create_client
+
         # Create a new client and set the session manually
-        client = create_client(
+        client = _tune_postgrest_session(create_client(
             settings.SUPABASE_URL,
             settings.SUPABASE_KEY
-        )
+        ))
         # Set the access token in the postgrest client
         client.postgrest.auth(access_token)
+
+        self._auth_clients[access_token] = (client, now)
+        while len(self._auth_clients) > _AUTH_CLIENT_CACHE_MAX:
+            _, (evicted, _) = self._auth_clients.popitem(last=False)
+            self._close_client_session(evicted)
         return client
     
+    @staticmethod
+    def _close_client_session(client: "Client") -> None:
+        """Close a cached client's HTTP session without raising
+        
+        Evicted and expired clients would otherwise leak their pooled
+        keep-alive sockets until garbage collection.
+        """
+        try:
+            client.postgrest.session.close()
+        except Exception:
+            pass
+    
     async def test_connection(self) -> bool:
         """
-        Test database connection
+        Test database connection, trusting a recent success
+        
+        Health probes call this frequently; a success within the last
+        few seconds is answered from memory instead of re-querying
+        Postgres. Failures are never cached, so a broken connection is
+        re-probed on every call.
+        
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        if time.monotonic() - self._last_ok_monotonic < _CONNECTION_OK_TTL:
+            return True
+        return await self.deep_test_connection()
+    
+    async def deep_test_connection(self) -> bool:
+        """
+        Test database connection with a real query (startup checks)
         
         Returns:
             True if connection is successful, False otherwise
         """
         try:
             # Try a simple query to test connection
-            result = self.anon_client.table('user_profiles').select('id').limit(1).execute()
+            result = await asyncio.to_thread(
+                lambda: self.anon_client.table('user_profiles').select('id').limit(1).execute()
+            )
             logger.info("Supabase connection test successful")
+            self._last_ok_monotonic = time.monotonic()
             return True
         except Exception as e:
             logger.error(f"Supabase connection test failed: {str(e)}")
+            self._last_ok_monotonic = 0.0
             return False
 
 
@@ -99,7 +240,7 @@ supabase_config = SupabaseConfig()
 
 
 # Convenience accessors
-def get_supabase_client(use_service_role: bool = False) -> Client:
+def get_supabase_client(use_service_role: bool = False) -> "Client":
     """
     Get Supabase client
     
@@ -115,7 +256,7 @@ def get_supabase_client(use_service_role: bool = False) -> Client:
     return supabase_config.anon_client
 
 
-def get_authenticated_supabase_client(access_token: str) -> Client:
+def get_authenticated_supabase_client(access_token: str) -> "Client":
     """
     Get Supabase client authenticated with user token
     
@@ -128,11 +269,16 @@ def get_authenticated_supabase_client(access_token: str) -> Client:
     return supabase_config.get_authenticated_client(access_token)
 
 
+# Default column list for record queries: everything the list views
+# need without falling back to "*" semantics
+_DEFAULT_RECORD_COLS = 'id,created_at,updated_at,tags,is_archived,data'
+
+
 # Database helper functions
 class SupabaseDatabase:
     """Helper class for common database operations"""
     
-    def __init__(self, client: Client):
+    def __init__(self, client: "Client"):
         self.client = client
     
     async def create_workspace(
@@ -161,25 +307,32 @@ class SupabaseDatabase:
             "config": config or {}
         }
         
-        result = self.client.table('workspaces').insert(data).execute()
+        # supabase-py blocks; run the round trip off the event loop
+        result = await asyncio.to_thread(
+            lambda: self.client.table('workspaces').insert(data).execute()
+        )
         return result.data[0] if result.data else None
     
     async def get_user_workspaces(self, user_id: str) -> list:
         """
         Get all workspaces for a user
         
+        Deprecated: this delegates to the module-level
+        app.utils.supabase_client.get_user_workspaces, which is the
+        single implementation and carries the TTL cache and
+        single-flight wrapper. Kept so existing SupabaseDatabase call
+        sites share the same code path and cache key.
+        
         Args:
             user_id: User ID
             
         Returns:
             List of workspaces
         """
-        result = self.client.table('workspace_members')\
-            .select('workspace_id, role, workspaces(*)')\
-            .eq('user_id', user_id)\
-            .execute()
+        # Imported here: app.utils.supabase_client imports this module
+        from app.utils.supabase_client import get_user_workspaces
         
-        return result.data if result.data else []
+        return await get_user_workspaces(self.client, user_id)
     
     async def create_entity(
         self,
@@ -210,10 +363,13 @@ class SupabaseDatabase:
             "display_name": display_name,
             "display_name_singular": display_name_singular,
             "fields": fields,
-            **kwargs
         }
+        if kwargs:
+            data.update(kwargs)
         
-        result = self.client.table('crm_entities').insert(data).execute()
+        result = await asyncio.to_thread(
+            lambda: self.client.table('crm_entities').insert(data).execute()
+        )
         return result.data[0] if result.data else None
     
     async def create_record(
@@ -242,10 +398,12 @@ class SupabaseDatabase:
             "entity_id": entity_id,
             "data": data,
             "created_by": created_by,
-            "tags": tags or []
+            "tags": tags if tags is not None else _EMPTY_TAGS
         }
         
-        result = self.client.table('crm_records').insert(record_data).execute()
+        result = await asyncio.to_thread(
+            lambda: self.client.table('crm_records').insert(record_data).execute()
+        )
         return result.data[0] if result.data else None
     
     async def get_records(
@@ -270,7 +428,7 @@ class SupabaseDatabase:
             List of records
         """
         query = self.client.table('crm_records')\
-            .select('*')\
+            .select(_DEFAULT_RECORD_COLS)\
             .eq('workspace_id', workspace_id)\
             .eq('entity_id', entity_id)\
             .eq('is_archived', archived)\
@@ -278,9 +436,61 @@ class SupabaseDatabase:
             .limit(limit)\
             .offset(offset)
         
-        result = query.execute()
+        result = await asyncio.to_thread(query.execute)
         return result.data if result.data else []
     
+    async def iter_records(
+        self,
+        workspace_id: str,
+        entity_id: str,
+        batch_size: int = 500,
+        archived: bool = False
+    ):
+        """
+        Stream all records for an entity in keyset-paginated batches
+        
+        Full-table iteration through get_records with a growing offset
+        is O(N^2): every page re-scans and discards the rows before it.
+        This pages on the (created_at, id) keyset instead, so each page
+        is a constant-cost index range scan no matter how deep the
+        iteration goes. Use this for exports and bulk processing.
+        
+        Args:
+            workspace_id: Workspace ID
+            entity_id: Entity ID
+            batch_size: Rows fetched per round trip
+            archived: Include archived records
+            
+        Yields:
+            Lists of records, newest first
+        """
+        last = None
+        while True:
+            query = self.client.table('crm_records')\
+                .select(_DEFAULT_RECORD_COLS)\
+                .eq('workspace_id', workspace_id)\
+                .eq('entity_id', entity_id)\
+                .eq('is_archived', archived)\
+                .order('created_at', desc=True)\
+                .order('id', desc=True)\
+                .limit(batch_size)
+            if last is not None:
+                # Strictly before the last row seen, with id as the
+                # tie-breaker for records sharing a created_at
+                query = query.or_(
+                    f"created_at.lt.{last[0]},"
+                    f"and(created_at.eq.{last[0]},id.lt.{last[1]})"
+                )
+            
+            result = await asyncio.to_thread(query.execute)
+            rows = result.data
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            last = (rows[-1]['created_at'], rows[-1]['id'])
+    
     async def create_activity(
         self,
         workspace_id: str,
@@ -310,15 +520,18 @@ class SupabaseDatabase:
             "activity_type": activity_type,
             "title": title,
             "created_by": created_by,
-            **kwargs
         }
+        if kwargs:
+            activity_data.update(kwargs)
         
-        result = self.client.table('activities').insert(activity_data).execute()
+        result = await asyncio.to_thread(
+            lambda: self.client.table('activities').insert(activity_data).execute()
+        )
         return result.data[0] if result.data else None
 
 
 # Helper to get database instance
-def get_database(client: Client = None) -> SupabaseDatabase:
+def get_database(client: "Client" = None) -> SupabaseDatabase:
     """
     Get database helper instance
     